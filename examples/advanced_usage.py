@@ -8,24 +8,72 @@ error recovery, monitoring, and integration with external systems.
 
 import sys
 import os
+import importlib.util
 import time
 import asyncio
-from typing import List, Dict, Any
+import threading
+from collections import deque
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
-import json
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+# Make the project importable when run from a source checkout
+if importlib.util.find_spec('src') is None:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.config import ConfigManager
 from src.minter import NFTMinter
 from src.exceptions import (
     MinterError, TransactionError, ContractError,
-    InsufficientFundsError
+    InsufficientFundsError, ConnectionError
 )
-from src.utils import format_wei_to_ether, parse_revert_reason
+from src.utils import format_wei_to_ether, parse_revert_reason, save_json_file
+from web3 import AsyncWeb3, WebSocketProvider
 import logging
 
 
+# Short-lived caches shared by cost estimations in this process. Gas price is
+# keyed by chain ID, the per-NFT mint cost by (contract address, group ID).
+_CACHE_TTL = 10  # seconds
+_gas_price_cache: Dict[int, Tuple[float, int]] = {}
+_mint_unit_cost_cache: Dict[Tuple[str, int], Tuple[float, int]] = {}
+_cache_lock = threading.Lock()
+_refreshing = set()
+
+
+def _cached_rpc_value(cache: dict, key, fetch):
+    """
+    Return a cached RPC value, refreshing it once its TTL has expired.
+    
+    While one caller is refreshing an expired entry, other callers are served
+    the stale value instead of issuing a duplicate request.
+    
+    Args:
+        cache: Cache dictionary mapping key to (timestamp, value)
+        key: Cache key
+        fetch: Callable that fetches a fresh value
+        
+    Returns:
+        The cached or freshly fetched value
+    """
+    with _cache_lock:
+        entry = cache.get(key)
+        if entry is not None:
+            if time.monotonic() - entry[0] < _CACHE_TTL:
+                return entry[1]
+            if (id(cache), key) in _refreshing:
+                return entry[1]
+        _refreshing.add((id(cache), key))
+    
+    try:
+        value = fetch()
+        with _cache_lock:
+            cache[key] = (time.monotonic(), value)
+        return value
+    finally:
+        with _cache_lock:
+            _refreshing.discard((id(cache), key))
+
+
 class AdvancedMinter:
     """Advanced minting strategies and patterns."""
     
@@ -34,25 +82,80 @@ class AdvancedMinter:
         self.config.load()
         self.logger = logging.getLogger(__name__)
         self.mint_history = []
+        self._minter: Optional[NFTMinter] = None
+        
+    def _record_mint(self, tx_hash: str, attempt: int = 1):
+        """
+        Append a successful mint to the history.
+        
+        Args:
+            tx_hash: Transaction hash
+            attempt: Attempt number that succeeded
+        """
+        self.mint_history.append({
+            'ts_ns': time.time_ns(),
+            'tx_hash': tx_hash,
+            'attempt': attempt,
+            'status': 'success'
+        })
+        
+    def to_json(self) -> List[Dict[str, Any]]:
+        """
+        Get the mint history in a JSON-serializable form.
+        
+        Timestamps are stored as integer nanoseconds and only formatted
+        as ISO 8601 strings here.
         
-    def mint_with_retry(self, max_retries: int = 3, delay: int = 5) -> bool:
+        Returns:
+            list: Mint history records with an ISO 'timestamp' field
+        """
+        records = []
+        for entry in self.mint_history:
+            record = {'timestamp': datetime.fromtimestamp(entry['ts_ns'] / 1e9).isoformat()}
+            record.update((k, v) for k, v in entry.items() if k != 'ts_ns')
+            records.append(record)
+        return records
+        
+    def _get_minter(self) -> NFTMinter:
+        """
+        Get the shared minter, connecting and loading the contract on first use.
+        
+        Returns:
+            NFTMinter: Connected minter with the contract loaded
+        """
+        if self._minter is None:
+            minter = NFTMinter(self.config)
+            minter.connect()
+            minter.load_contract()
+            self._minter = minter
+        return self._minter
+        
+    def mint_with_retry(
+        self,
+        max_retries: int = 3,
+        delay: int = 5,
+        minter: Optional[NFTMinter] = None
+    ) -> bool:
         """
         Mint with automatic retry on failure.
         
         Args:
             max_retries: Maximum number of retry attempts
             delay: Delay between retries in seconds
+            minter: Connected minter to use (default: the shared minter)
             
         Returns:
             bool: True if successful, False otherwise
         """
         for attempt in range(max_retries):
             try:
-                self.logger.info(f"Mint attempt {attempt + 1}/{max_retries}")
+                self.logger.info("Mint attempt %d/%d", attempt + 1, max_retries)
                 
-                minter = NFTMinter(self.config)
-                minter.connect()
-                minter.load_contract()
+                if minter is None:
+                    minter = self._get_minter()
+                else:
+                    # A failed attempt (or earlier use by the caller) may have consumed the nonce
+                    minter.refresh_nonce()
                 
                 # Check if we have enough balance
                 balance = minter.get_wallet_balance()
@@ -64,19 +167,14 @@ class AdvancedMinter:
                 tx_hash = minter.mint()
                 
                 if tx_hash:
-                    self.logger.info(f"Success! TX: {tx_hash}")
-                    self.mint_history.append({
-                        'timestamp': datetime.now().isoformat(),
-                        'tx_hash': tx_hash,
-                        'attempt': attempt + 1,
-                        'status': 'success'
-                    })
+                    self.logger.info("Success! TX: %s", tx_hash)
+                    self._record_mint(tx_hash, attempt + 1)
                     return True
                     
             except TransactionError as e:
                 # Parse revert reason
                 reason = parse_revert_reason(e)
-                self.logger.warning(f"Transaction failed: {reason or str(e)}")
+                self.logger.warning("Transaction failed: %s", reason or str(e))
                 
                 # Don't retry if it's a permanent error
                 if reason and any(msg in reason.lower() for msg in [
@@ -86,11 +184,16 @@ class AdvancedMinter:
                     break
                     
                 if attempt < max_retries - 1:
-                    self.logger.info(f"Retrying in {delay} seconds...")
+                    self.logger.info("Retrying in %s seconds...", delay)
                     time.sleep(delay)
                     
             except Exception as e:
-                self.logger.error(f"Unexpected error: {e}")
+                self.logger.error("Unexpected error: %s", e)
+                if isinstance(e, ConnectionError):
+                    # Reconnect on the next attempt
+                    if minter is self._minter:
+                        self._minter = None
+                    minter = None
                 if attempt < max_retries - 1:
                     time.sleep(delay)
         
@@ -100,50 +203,132 @@ class AdvancedMinter:
         self, 
         total_amount: int, 
         batch_size: int = 10,
-        delay_between_batches: int = 2
+        max_inflight: int = 3,
+        poll_interval: float = 1.0,
+        receipt_timeout: int = 300
     ) -> List[str]:
         """
         Mint NFTs in batches to avoid gas limits.
         
+        All batch transactions are signed up front with sequential nonces,
+        starting from the account's pending nonce. Up to max_inflight of them
+        are kept pending at once: the next batch is sent while earlier ones
+        are still confirming, and all pending receipts are polled in a single
+        JSON-RPC batch.
+        
         Args:
             total_amount: Total number of NFTs to mint
             batch_size: Number of NFTs per batch
-            delay_between_batches: Delay between batches in seconds
+            max_inflight: Maximum number of unconfirmed batch transactions
+            poll_interval: Seconds between receipt polls
+            receipt_timeout: Maximum seconds to wait for a receipt
             
         Returns:
-            list: Transaction hashes
+            list: Transaction hashes of confirmed batches
         """
         tx_hashes = []
+        signed = deque()  # (batch size, raw transaction)
+        pending = deque()  # (tx_hash, submitted_at)
         remaining = total_amount
+        submitted = 0
+        minting_config = self.config.data.setdefault('minting', {})
+        
+        try:
+            minter = self._get_minter()
+            minter.refresh_nonce()
+        except Exception as e:
+            self.logger.error("Batch failed, stopping: %s", e)
+            return tx_hashes
         
+        # Sign every batch ahead of time
         while remaining > 0:
             current_batch = min(batch_size, remaining)
             
-            self.logger.info(
-                f"Minting batch: {current_batch} NFTs "
-                f"({total_amount - remaining + current_batch}/{total_amount})"
-            )
-            
             # Update configuration for this batch
-            self.config.set('minting.amount', current_batch)
+            minting_config['amount'] = current_batch
             
-            # Mint this batch
-            if self.mint_with_retry():
-                tx_hashes.extend(self.mint_history[-1:])
-                remaining -= current_batch
-                
-                if remaining > 0:
-                    self.logger.info(
-                        f"Waiting {delay_between_batches}s before next batch..."
-                    )
-                    time.sleep(delay_between_batches)
-            else:
-                self.logger.error("Batch failed, stopping")
+            try:
+                signed.append((current_batch, minter.sign_mint()))
+            except MinterError as e:
+                self.logger.error("Could not sign remaining batches: %s", e)
                 break
+            
+            remaining -= current_batch
+        
+        while signed or pending:
+            # Keep the pipeline full
+            while signed and len(pending) < max_inflight:
+                current_batch, raw_transaction = signed.popleft()
+                submitted += current_batch
+                
+                self.logger.info(
+                    "Minting batch: %d NFTs (%d/%d)",
+                    current_batch, submitted, total_amount
+                )
+                
+                if raw_transaction is None:
+                    # Dry run
+                    continue
+                
+                try:
+                    tx_hash = minter.send_signed_transaction(raw_transaction)
+                except MinterError as e:
+                    self.logger.error("Batch failed, stopping: %s", e)
+                    self._discard_signed(minter, signed)
+                    break
+                
+                pending.append((tx_hash, time.monotonic()))
+            
+            if not pending:
+                continue
+            
+            # Poll every in-flight transaction at once
+            receipts = minter.get_transaction_receipts([h for h, _ in pending])
+            still_pending = deque()
+            
+            for (tx_hash, submitted_at), receipt in zip(pending, receipts):
+                if receipt is None:
+                    if time.monotonic() - submitted_at > receipt_timeout:
+                        self.logger.error("Timed out waiting for %s, stopping", tx_hash)
+                        self._discard_signed(minter, signed)
+                    else:
+                        still_pending.append((tx_hash, submitted_at))
+                elif receipt['status'] == 0:
+                    self.logger.error("Batch transaction %s failed, stopping", tx_hash)
+                    self._discard_signed(minter, signed)
+                else:
+                    self.logger.info("Batch confirmed! TX: %s", tx_hash)
+                    tx_hashes.append(tx_hash)
+                    self._record_mint(tx_hash)
+            
+            # Only wait when nothing could be confirmed or sent
+            if len(still_pending) == len(pending) and (
+                not signed or len(still_pending) >= max_inflight
+            ):
+                time.sleep(poll_interval)
+            pending = still_pending
         
         return tx_hashes
     
-    def monitor_and_mint(
+    def _discard_signed(self, minter: NFTMinter, signed: deque):
+        """
+        Drop pre-signed transactions that will not be sent.
+        
+        Their nonces were reserved locally, as was the nonce of a send that
+        just failed, so the minter's nonce is always re-read from the
+        network afterwards, even when no transactions are left queued.
+        
+        Args:
+            minter: Minter that signed the transactions
+            signed: Queue of unsent signed transactions
+        """
+        signed.clear()
+        try:
+            minter.refresh_nonce()
+        except Exception as e:
+            self.logger.warning("Could not refresh nonce: %s", e)
+    
+    async def monitor_and_mint(
         self,
         check_interval: int = 30,
         max_wait_time: int = 3600
@@ -151,69 +336,160 @@ class AdvancedMinter:
         """
         Monitor contract and mint when conditions are met.
         
+        When 'network.ws_rpc' is configured the contract state is re-checked
+        on every new block (newHeads subscription); otherwise it is polled
+        every check_interval seconds. A single connected NFTMinter is reused
+        for all checks.
+        
+        max_wait_time only bounds the wait for mint conditions. Once minting
+        has started it runs to completion, since the executor thread that
+        signs and sends the transaction cannot be cancelled.
+        
         Args:
-            check_interval: Seconds between checks
-            max_wait_time: Maximum time to wait in seconds
+            check_interval: Seconds between checks when polling
+            max_wait_time: Maximum time to wait for mint conditions in seconds
             
         Returns:
             bool: True if minted successfully
         """
-        start_time = time.time()
+        try:
+            minter = self._get_minter()
+        except Exception as e:
+            self.logger.error("Error during monitoring: %s", e)
+            return False
         
-        while time.time() - start_time < max_wait_time:
-            try:
-                minter = NFTMinter(self.config)
-                minter.connect()
-                minter.load_contract()
-                
-                info = minter.get_contract_info()
+        ws_rpc = self.config.get('network.ws_rpc')
+        if ws_rpc:
+            monitor = self._monitor_new_heads(minter, ws_rpc, check_interval)
+        else:
+            monitor = self._monitor_polling(minter, check_interval)
+        
+        try:
+            ready = await asyncio.wait_for(monitor, timeout=max_wait_time)
+        except asyncio.TimeoutError:
+            self.logger.error("Timeout reached while monitoring")
+            return False
+        
+        if not ready:
+            return False
+        
+        # All conditions met, attempt to mint (no deadline from here on)
+        self.logger.info("Conditions met, attempting to mint...")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.mint_with_retry)
+    
+    async def _check_mint_conditions(self, minter: NFTMinter) -> Optional[bool]:
+        """
+        Check contract state once.
+        
+        Args:
+            minter: Connected minter with the contract loaded
+            
+        Returns:
+            True when ready to mint, False if minting can't succeed,
+            or None to keep waiting
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            info = await loop.run_in_executor(None, minter.get_contract_info)
+        except Exception as e:
+            self.logger.error("Error during monitoring: %s", e)
+            return None
+        
+        # Check various conditions
+        if not info.get('mint_live', False):
+            self.logger.info("Mint not live yet, waiting...")
+            return None
+        if info['total_supply'] >= info['max_supply']:
+            self.logger.error("Max supply reached!")
+            return False
+        
+        return True
+    
+    async def _monitor_polling(self, minter: NFTMinter, check_interval: int) -> bool:
+        """Re-check contract state every check_interval seconds."""
+        while True:
+            result = await self._check_mint_conditions(minter)
+            if result is not None:
+                return result
+            await asyncio.sleep(check_interval)
+    
+    async def _monitor_new_heads(
+        self,
+        minter: NFTMinter,
+        ws_rpc: str,
+        check_interval: int
+    ) -> bool:
+        """
+        Re-check contract state on every new block header.
+        
+        Falls back to polling if the websocket subscription fails.
+        """
+        try:
+            async with AsyncWeb3(WebSocketProvider(ws_rpc)) as w3:
+                await w3.eth.subscribe('newHeads')
+                self.logger.info("Subscribed to new blocks via %s", ws_rpc)
                 
-                # Check various conditions
-                if not info.get('mint_live', False):
-                    self.logger.info("Mint not live yet, waiting...")
-                elif info['total_supply'] >= info['max_supply']:
-                    self.logger.error("Max supply reached!")
-                    return False
-                else:
-                    # All conditions met, attempt to mint
-                    self.logger.info("Conditions met, attempting to mint...")
-                    return self.mint_with_retry()
+                result = await self._check_mint_conditions(minter)
+                if result is not None:
+                    return result
                 
-            except Exception as e:
-                self.logger.error(f"Error during monitoring: {e}")
-            
-            time.sleep(check_interval)
+                async for _ in w3.socket.process_subscriptions():
+                    result = await self._check_mint_conditions(minter)
+                    if result is not None:
+                        return result
+        except Exception as e:
+            self.logger.warning(
+                "Block subscription failed (%s), falling back to polling", e
+            )
         
-        self.logger.error("Timeout reached while monitoring")
-        return False
+        return await self._monitor_polling(minter, check_interval)
     
-    def estimate_total_cost(self, amount: int) -> Dict[str, Any]:
+    def estimate_total_cost(
+        self,
+        amount: int,
+        minter: Optional[NFTMinter] = None
+    ) -> Dict[str, Any]:
         """
         Estimate total cost for minting including gas.
         
+        The mint price is derived from the cached per-NFT cost unless
+        'minting.tiered_pricing' is enabled, in which case the contract is
+        quoted for the full amount.
+        
         Args:
             amount: Number of NFTs to mint
+            minter: Connected minter to use (default: the shared minter)
             
         Returns:
             dict: Cost breakdown
         """
         try:
-            minter = NFTMinter(self.config)
-            minter.connect()
-            minter.load_contract()
+            if minter is None:
+                minter = self._get_minter()
             
-            # Get current gas price
-            gas_price = minter.web3.eth.gas_price
+            # Get current gas price (cached for a few seconds per chain)
+            gas_price = _cached_rpc_value(
+                _gas_price_cache,
+                minter.chain_id,
+                lambda: minter.web3.eth.gas_price
+            )
             
             # Estimate gas for transaction
             # This is a rough estimate, actual may vary
             estimated_gas = 150000 + (50000 * amount)  # Base + per NFT
             
             # Get mint price (if any)
-            mint_cost = minter._get_mint_cost(
-                self.config.get('minting.group_id'),
-                amount
-            )
+            group_id = self.config.get('minting.group_id')
+            if self.config.get('minting.tiered_pricing'):
+                mint_cost = minter._get_mint_cost(group_id, amount)
+            else:
+                unit_cost = _cached_rpc_value(
+                    _mint_unit_cost_cache,
+                    (self.config.get('contract.address'), group_id),
+                    lambda: minter._get_mint_cost(group_id, 1)
+                )
+                mint_cost = unit_cost * amount
             
             # Calculate totals
             gas_cost_wei = estimated_gas * gas_price
@@ -229,13 +505,17 @@ class AdvancedMinter:
             }
             
         except Exception as e:
-            self.logger.error(f"Error estimating cost: {e}")
+            self.logger.error("Error estimating cost: %s", e)
             return {}
 
 
 class MintingScheduler:
     """Schedule minting operations at specific times."""
     
+    # Seconds before the target time to connect and to sign the transaction
+    PREWARM_SECONDS = 5
+    PRESIGN_SECONDS = 1
+    
     def __init__(self, config_path: str = "config.json"):
         self.minter = AdvancedMinter(config_path)
         self.logger = logging.getLogger(__name__)
@@ -244,6 +524,10 @@ class MintingScheduler:
         """
         Schedule a mint operation at a specific time.
         
+        The minter connects and loads the contract PREWARM_SECONDS early and
+        signs the transaction PRESIGN_SECONDS early, so only the raw
+        transaction has to be sent at the target time.
+        
         Args:
             target_time: DateTime when to execute the mint
             
@@ -257,14 +541,61 @@ class MintingScheduler:
         
         wait_seconds = (target_time - now).total_seconds()
         self.logger.info(
-            f"Scheduled mint for {target_time}. "
-            f"Waiting {wait_seconds:.0f} seconds..."
+            "Scheduled mint for %s. Waiting %.0f seconds...",
+            target_time, wait_seconds
         )
         
-        await asyncio.sleep(wait_seconds)
+        # Connect and load the contract off the critical path
+        await self._sleep_until(target_time, self.PREWARM_SECONDS)
+        try:
+            minter = self.minter._get_minter()
+        except Exception as e:
+            self.logger.warning("Pre-warming failed: %s", e)
+            await self._sleep_until(target_time)
+            self.logger.info("Executing scheduled mint...")
+            return self.minter.mint_with_retry()
+        
+        # Sign with a fresh nonce and gas price just before the target time
+        await self._sleep_until(target_time, self.PRESIGN_SECONDS)
+        try:
+            minter.refresh_nonce()
+            raw_transaction = minter.sign_mint()
+        except Exception as e:
+            self.logger.warning("Pre-signing failed: %s", e)
+            raw_transaction = None
         
+        await self._sleep_until(target_time)
         self.logger.info("Executing scheduled mint...")
-        return self.minter.mint_with_retry()
+        
+        if raw_transaction is None:
+            return self.minter.mint_with_retry(minter=minter)
+        
+        try:
+            tx_hash = minter.send_signed_transaction(raw_transaction)
+            minter.await_receipt(tx_hash)
+        except TransactionError as e:
+            self.logger.warning("Pre-signed mint failed (%s), retrying", e)
+            try:
+                minter.refresh_nonce()
+            except Exception as nonce_error:
+                self.logger.warning("Could not refresh nonce: %s", nonce_error)
+            return self.minter.mint_with_retry(minter=minter)
+        
+        self.logger.info("Success! TX: %s", tx_hash)
+        self.minter._record_mint(tx_hash)
+        return True
+    
+    async def _sleep_until(self, target_time: datetime, lead_seconds: float = 0):
+        """
+        Sleep until lead_seconds before target_time.
+        
+        Args:
+            target_time: DateTime to sleep towards
+            lead_seconds: Seconds before target_time to wake up
+        """
+        delay = (target_time - datetime.now()).total_seconds() - lead_seconds
+        if delay > 0:
+            await asyncio.sleep(delay)
     
     async def recurring_mint(
         self,
@@ -281,13 +612,13 @@ class MintingScheduler:
         iteration = 0
         
         while max_iterations is None or iteration < max_iterations:
-            self.logger.info(f"Recurring mint iteration {iteration + 1}")
+            self.logger.info("Recurring mint iteration %d", iteration + 1)
             
             success = self.minter.mint_with_retry()
             
             if success:
                 self.logger.info(
-                    f"Mint successful. Next attempt in {interval_minutes} minutes"
+                    "Mint successful. Next attempt in %s minutes", interval_minutes
                 )
             else:
                 self.logger.warning("Mint failed")
@@ -323,14 +654,13 @@ def example_batch_minting():
     tx_hashes = minter.mint_in_batches(
         total_amount=50,
         batch_size=10,
-        delay_between_batches=5
+        max_inflight=3
     )
     
     print(f"\nCompleted {len(tx_hashes)} transactions")
     
     # Save mint history
-    with open('mint_history.json', 'w') as f:
-        json.dump(minter.mint_history, f, indent=2)
+    save_json_file(minter.to_json(), 'mint_history.json')
 
 
 async def example_scheduled_minting():
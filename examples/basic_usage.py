@@ -8,7 +8,12 @@ for programmatic minting without using the CLI.
 
 import sys
 import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+
+# Make the project importable when run from a source checkout
+if importlib.util.find_spec('src') is None:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from src.config import ConfigManager
 from src.minter import NFTMinter
@@ -113,7 +118,7 @@ def custom_configuration_example():
 
 
 def multi_wallet_example():
-    """Example of minting from multiple wallets."""
+    """Example of minting from multiple wallets concurrently."""
     
     wallets = [
         {
@@ -129,16 +134,33 @@ def multi_wallet_example():
     base_config = ConfigManager()
     base_config.load()
     
-    for i, wallet in enumerate(wallets):
+    def mint_one(i, wallet):
         print(f"\nMinting from wallet {i + 1}...")
         
-        # Update wallet configuration
-        base_config.set("wallet.private_key", wallet["private_key"])
-        base_config.set("wallet.address", wallet["address"])
+        # Each wallet gets its own configuration copy and minter, so
+        # accounts and nonces never collide between threads
+        config = ConfigManager(base_config.config_path)
+        config.data = base_config._deep_copy(base_config.data)
+        config.data['wallet'].update(wallet)
         
         # Create minter and execute
-        minter = NFTMinter(base_config, dry_run=True)
-        # ... continue with minting process
+        minter = NFTMinter(config, dry_run=True)
+        minter.connect()
+        minter.load_contract()
+        return minter.mint()
+    
+    # Minting is I/O-bound, so threads let each wallet's RPC round trips overlap
+    with ThreadPoolExecutor(max_workers=len(wallets)) as executor:
+        futures = [
+            executor.submit(mint_one, i, wallet)
+            for i, wallet in enumerate(wallets)
+        ]
+    
+    for i, future in enumerate(futures):
+        try:
+            print(f"Wallet {i + 1} result: {future.result()}")
+        except MinterError as e:
+            print(f"Wallet {i + 1} failed: {e}")
 
 
 if __name__ == "__main__":
@@ -10,18 +10,67 @@ the minting process.
 import argparse
 import logging
 import sys
-import os
-from pathlib import Path
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.config import ConfigManager
 from src.minter import NFTMinter
 from src.exceptions import MinterError, ConfigurationError
+from src.networks import NETWORKS
 from src.utils import setup_logging, validate_ethereum_address
 
 
+# Command line overrides: (argument, config section and key, log label)
+_OVERRIDE_MAP = (
+    ('network', ('network', 'name'), 'Network'),
+    ('amount', ('minting', 'amount'), 'Mint amount'),
+    ('group', ('minting', 'group_id'), 'Group ID'),
+    ('to_address', ('minting', 'to_address'), 'Recipient address'),
+)
+
+
+def mint_amount(value):
+    """
+    Parse a mint amount argument (-1 for max, or a positive integer).
+    
+    Args:
+        value: Command line value
+        
+    Returns:
+        int: Parsed amount
+        
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a valid amount
+    """
+    try:
+        amount = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if amount < -1 or amount == 0:
+        raise argparse.ArgumentTypeError("must be -1 (for max) or greater than 0")
+    return amount
+
+
+def non_negative_int(value):
+    """
+    Parse a non-negative integer argument.
+    
+    Args:
+        value: Command line value
+        
+    Returns:
+        int: Parsed integer
+        
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a non-negative integer
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError("must be non-negative")
+    return number
+
+
 def parse_arguments():
     """
     Parse command line arguments for the NFT minter.
@@ -50,19 +99,19 @@ Examples:
     
     parser.add_argument(
         '-n', '--network',
-        type=str,
+        choices=tuple(NETWORKS),
         help='Override network from config (e.g., ARBITRUM_ONE, BERACHAIN)'
     )
     
     parser.add_argument(
         '-a', '--amount',
-        type=int,
+        type=mint_amount,
         help='Override mint amount from config'
     )
     
     parser.add_argument(
         '-g', '--group',
-        type=int,
+        type=non_negative_int,
         help='Override group ID from config'
     )
     
@@ -91,6 +140,8 @@ def validate_overrides(args, config):
     """
     Validate command line overrides against configuration.
     
+    Network, amount and group are already validated by argparse.
+    
     Args:
         args: Command line arguments
         config: Configuration manager instance
@@ -98,23 +149,6 @@ def validate_overrides(args, config):
     Raises:
         ConfigurationError: If validation fails
     """
-    # Validate network override
-    if args.network:
-        valid_networks = ['ARBITRUM_ONE', 'ARBITRUM_NOVA', 'ARBITRUM_SEPOLIA', 'BERACHAIN']
-        if args.network not in valid_networks:
-            raise ConfigurationError(
-                f"Invalid network: {args.network}. "
-                f"Valid options: {', '.join(valid_networks)}"
-            )
-    
-    # Validate amount override
-    if args.amount is not None and args.amount < -1:
-        raise ConfigurationError("Amount must be -1 (for max) or greater than 0")
-    
-    # Validate group override
-    if args.group is not None and args.group < 0:
-        raise ConfigurationError("Group ID must be non-negative")
-    
     # Validate to_address override
     if args.to_address:
         if not validate_ethereum_address(args.to_address):
@@ -129,21 +163,11 @@ def apply_overrides(config, args):
         config: Configuration manager instance
         args: Command line arguments
     """
-    if args.network:
-        config.data['network']['name'] = args.network
-        logging.info(f"Network overridden to: {args.network}")
-    
-    if args.amount is not None:
-        config.data['minting']['amount'] = args.amount
-        logging.info(f"Mint amount overridden to: {args.amount}")
-    
-    if args.group is not None:
-        config.data['minting']['group_id'] = args.group
-        logging.info(f"Group ID overridden to: {args.group}")
-    
-    if args.to_address:
-        config.data['minting']['to_address'] = args.to_address
-        logging.info(f"Recipient address overridden to: {args.to_address}")
+    for attr, (section, key), label in _OVERRIDE_MAP:
+        value = getattr(args, attr)
+        if value is not None:
+            config.data[section][key] = value
+            logging.info("%s overridden to: %s", label, value)
 
 
 def main():
@@ -172,10 +196,10 @@ def main():
         apply_overrides(config, args)
         
         # Log configuration summary
-        logger.info(f"Network: {config.get('network.name')}")
-        logger.info(f"Contract: {config.get('contract.address')}")
-        logger.info(f"Group ID: {config.get('minting.group_id')}")
-        logger.info(f"Amount: {config.get('minting.amount')}")
+        logger.info("Network: %s", config.get('network.name'))
+        logger.info("Contract: %s", config.get('contract.address'))
+        logger.info("Group ID: %s", config.get('minting.group_id'))
+        logger.info("Amount: %s", config.get('minting.amount'))
         
         if args.dry_run:
             logger.info("DRY RUN MODE - No transactions will be executed")
@@ -191,15 +215,15 @@ def main():
         logger.info("Loading smart contract...")
         minter.load_contract()
         
-        # Display contract information
-        contract_info = minter.get_contract_info()
-        logger.info(f"Contract total supply: {contract_info['total_supply']}")
-        logger.info(f"Contract max supply: {contract_info['max_supply']}")
-        logger.info(f"Minting status: {'LIVE' if contract_info['mint_live'] else 'NOT LIVE'}")
+        # Fetch contract information, wallet balance and gas price in one batch
+        contract_info = minter.get_startup_state()
+        logger.info("Contract total supply: %s", contract_info['total_supply'])
+        logger.info("Contract max supply: %s", contract_info['max_supply'])
+        logger.info("Minting status: %s", 'LIVE' if contract_info['mint_live'] else 'NOT LIVE')
         
         # Check wallet balance
-        balance = minter.get_wallet_balance()
-        logger.info(f"Wallet balance: {balance} ETH")
+        balance = contract_info['balance']
+        logger.info("Wallet balance: %s ETH", balance)
         
         if not args.dry_run and balance == 0:
             raise MinterError("Insufficient balance for gas fees")
@@ -214,7 +238,7 @@ def main():
         result = minter.mint()
         
         if result:
-            logger.info(f"Minting successful! Transaction hash: {result}")
+            logger.info("Minting successful! Transaction hash: %s", result)
             logger.info("View transaction on block explorer:")
             logger.info(minter.get_transaction_url(result))
         else:
@@ -223,16 +247,16 @@ def main():
         logger.info("NFT Batch Minter completed successfully!")
         
     except ConfigurationError as e:
-        logger.error(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
         sys.exit(1)
     except MinterError as e:
-        logger.error(f"Minting error: {e}")
+        logger.error("Minting error: %s", e)
         sys.exit(2)
     except KeyboardInterrupt:
         logger.warning("Process interrupted by user")
         sys.exit(130)
     except Exception as e:
-        logger.exception(f"Unexpected error: {e}")
+        logger.exception("Unexpected error: %s", e)
         sys.exit(3)
 
 
@@ -7,6 +7,7 @@ It discovers and executes all test files in the tests directory.
 """
 
 import sys
+import importlib.util
 import unittest
 import os
 from pathlib import Path
@@ -20,6 +21,40 @@ def run_tests(verbosity=2, pattern='test*.py'):
     """
     Run all tests in the tests directory.
     
+    Tests are run with pytest, in parallel worker processes when
+    pytest-xdist is installed. Without pytest, unittest is used.
+    
+    Args:
+        verbosity: Test output verbosity (0-2)
+        pattern: File pattern for test discovery
+        
+    Returns:
+        bool: True if all tests passed, False otherwise
+    """
+    try:
+        import pytest
+    except ImportError:
+        return _run_unittest(verbosity, pattern)
+    
+    args = ['--tb=short', '-o', f'python_files={pattern}']
+    if verbosity == 0:
+        args.append('-q')
+    elif verbosity >= 2:
+        args.append('-v')
+    
+    if importlib.util.find_spec('xdist') is not None:
+        # Keep each TestCase class on one worker; classes share no state
+        args.extend(['-n', 'auto', '--dist=loadscope'])
+    
+    args.append(str(project_root / 'tests'))
+    
+    return pytest.main(args) == 0
+
+
+def _run_unittest(verbosity=2, pattern='test*.py'):
+    """
+    Run all tests in the tests directory with unittest.
+    
     Args:
         verbosity: Test output verbosity (0-2)
         pattern: File pattern for test discovery
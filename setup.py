@@ -9,15 +9,16 @@ import os
 import sys
 import subprocess
 import platform
+import venv
 from pathlib import Path
 
 
 def create_directories():
     """Create necessary project directories."""
-    directories = ['logs', 'abi', 'output']
+    directories = ('logs', 'abi', 'output')
     for directory in directories:
-        Path(directory).mkdir(exist_ok=True)
-        print(f"✓ Created directory: {directory}/")
+        os.makedirs(directory, exist_ok=True)
+    print("\n".join(f"✓ Created directory: {directory}/" for directory in directories))
 
 
 def create_virtual_environment():
@@ -27,7 +28,9 @@ def create_virtual_environment():
         return
     
     print("Creating virtual environment...")
-    subprocess.run([sys.executable, '-m', 'venv', 'venv'], check=True)
+    # Build in-process rather than spawning another interpreter
+    builder = venv.EnvBuilder(with_pip=True, symlinks=platform.system() != 'Windows')
+    builder.create('venv')
     print("✓ Virtual environment created")
 
 
@@ -44,8 +47,14 @@ def install_dependencies():
     pip_cmd = get_pip_command()
     
     print("\nInstalling dependencies...")
-    subprocess.run([pip_cmd, 'install', '--upgrade', 'pip'], check=True)
-    subprocess.run([pip_cmd, 'install', '-r', 'requirements.txt'], check=True)
+    # One pip run: a version floor upgrades an old bundled pip without
+    # --upgrade, which would also bump every already-satisfied requirement
+    env = dict(os.environ, PIP_DISABLE_PIP_VERSION_CHECK='1')
+    subprocess.run(
+        [pip_cmd, 'install', '--no-input', 'pip>=23.1', '-r', 'requirements.txt'],
+        check=True,
+        env=env
+    )
     print("✓ Dependencies installed")
 
 
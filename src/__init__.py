@@ -9,16 +9,21 @@ __version__ = "1.0.0"
 __author__ = "Justice"
 __license__ = "AGPL-3.0 license"
 
-from .minter import NFTMinter
-from .config import ConfigManager
-from .exceptions import (
-    MinterError,
-    ConfigurationError,
-    ConnectionError,
-    ContractError,
-    TransactionError,
-    ValidationError
-)
+import importlib
+
+# Public names and the submodules that define them. Submodules are only
+# imported on first access, so e.g. importing an exception does not pull in
+# web3.
+_LAZY = {
+    'NFTMinter': '.minter',
+    'ConfigManager': '.config',
+    'MinterError': '.exceptions',
+    'ConfigurationError': '.exceptions',
+    'ConnectionError': '.exceptions',
+    'ContractError': '.exceptions',
+    'TransactionError': '.exceptions',
+    'ValidationError': '.exceptions',
+}
 
 __all__ = [
     'NFTMinter',
@@ -29,4 +34,14 @@ __all__ = [
     'ContractError',
     'TransactionError',
     'ValidationError'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Import public names from their submodules on first access (PEP 562)."""
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
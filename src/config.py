@@ -8,11 +8,26 @@ NFT minter application. It supports both JSON files and environment variables.
 import json
 import os
 import logging
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Union
 from pathlib import Path
 
 from .exceptions import ConfigurationError
-from .utils import validate_ethereum_address
+from .networks import NETWORKS
+from .utils import load_json_file, save_json_file, validate_ethereum_address
+
+
+# Network names accepted in network.name
+_VALID_NETWORKS = frozenset(NETWORKS)
+
+# Sentinel for missing keys in ConfigManager.get
+_MISSING = object()
+
+
+@lru_cache(maxsize=128)
+def _split_key(key: str) -> tuple:
+    """Split a dot-notation configuration key into its parts."""
+    return tuple(key.split('.'))
 
 
 class ConfigManager:
@@ -23,6 +38,8 @@ class ConfigManager:
     with support for nested keys, validation, and environment variable overrides.
     """
     
+    __slots__ = ('config_path', 'data', 'logger', '_validated_fingerprint')
+    
     # Default configuration structure
     DEFAULT_CONFIG = {
         "wallet": {
@@ -31,7 +48,9 @@ class ConfigManager:
         },
         "network": {
             "name": "BERACHAIN",
-            "custom_rpc": None
+            "custom_rpc": None,
+            "ws_rpc": None,
+            "rpc_failover": False
         },
         "contract": {
             "address": "",
@@ -42,7 +61,8 @@ class ConfigManager:
             "group_id": 0,
             "amount": 1,
             "to_address": "DEFAULT",
-            "auto_max": False
+            "auto_max": False,
+            "tiered_pricing": False
         }
     }
     
@@ -52,15 +72,21 @@ class ConfigManager:
         "WALLET_ADDRESS": "wallet.address",
         "NETWORK_NAME": "network.name",
         "NETWORK_RPC": "network.custom_rpc",
+        "NETWORK_WS_RPC": "network.ws_rpc",
+        "NETWORK_RPC_FAILOVER": "network.rpc_failover",
         "CONTRACT_ADDRESS": "contract.address",
         "CONTRACT_ABI_PATH": "contract.abi_path",
         "EXPLORER_API_KEY": "contract.explorer_api_key",
         "MINTING_GROUP_ID": "minting.group_id",
         "MINTING_AMOUNT": "minting.amount",
         "MINTING_TO_ADDRESS": "minting.to_address",
-        "MINTING_AUTO_MAX": "minting.auto_max"
+        "MINTING_AUTO_MAX": "minting.auto_max",
+        "MINTING_TIERED_PRICING": "minting.tiered_pricing"
     }
     
+    # ENV_MAPPINGS keys pre-split into path tuples
+    _ENV_PATHS = {env: tuple(key.split('.')) for env, key in ENV_MAPPINGS.items()}
+    
     def __init__(self, config_path: str = "config.json"):
         """
         Initialize the configuration manager.
@@ -71,6 +97,7 @@ class ConfigManager:
         self.config_path = Path(config_path)
         self.data = {}
         self.logger = logging.getLogger(__name__)
+        self._validated_fingerprint = None
         
     def load(self):
         """
@@ -85,7 +112,7 @@ class ConfigManager:
             ConfigurationError: If configuration file is invalid
         """
         # Start with default configuration
-        self.data = self._deep_copy(self.DEFAULT_CONFIG)
+        self.data = self._default_config()
         
         # Load from file if it exists
         if self.config_path.exists():
@@ -99,7 +126,8 @@ class ConfigManager:
         # Override with environment variables
         self._load_from_env()
         
-        self.logger.debug(f"Configuration loaded: {self._sanitized_config()}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Configuration loaded: %s", self._sanitized_config())
         
     def _load_from_file(self):
         """
@@ -109,8 +137,7 @@ class ConfigManager:
             ConfigurationError: If file cannot be read or parsed
         """
         try:
-            with open(self.config_path, 'r') as f:
-                file_config = json.load(f)
+            file_config = load_json_file(self.config_path)
             
             # Merge with existing config
             self._merge_config(self.data, file_config)
@@ -135,7 +162,7 @@ class ConfigManager:
             if value is not None:
                 # Convert value type based on the target
                 converted_value = self._convert_env_value(value, config_key)
-                self._set_nested(self.data, config_key, converted_value)
+                self._set_nested(self.data, self._ENV_PATHS[env_var], converted_value)
                 env_loaded = True
                 self.logger.debug(f"Loaded {config_key} from ${env_var}")
         
@@ -176,53 +203,73 @@ class ConfigManager:
         """
         Validate the loaded configuration.
         
+        Validating again without changes to the checked values returns
+        immediately.
+        
         Raises:
             ConfigurationError: If configuration is invalid
         """
         errors = []
+        is_address = validate_ethereum_address
+        
+        # Read each section once instead of resolving every dotted key
+        wallet = self.data.get('wallet') or {}
+        network_config = self.data.get('network') or {}
+        contract = self.data.get('contract') or {}
+        minting = self.data.get('minting') or {}
+        
+        fingerprint = (
+            wallet.get('private_key'), wallet.get('address'),
+            network_config.get('name'),
+            contract.get('address'), contract.get('abi_path'),
+            contract.get('explorer_api_key'),
+            minting.get('amount'), minting.get('group_id'),
+            minting.get('to_address')
+        )
+        if fingerprint == self._validated_fingerprint:
+            return
         
         # Validate wallet configuration
-        if not self.get('wallet.private_key'):
+        if not wallet.get('private_key'):
             errors.append("wallet.private_key is required")
         
-        wallet_address = self.get('wallet.address')
-        if wallet_address and not validate_ethereum_address(wallet_address):
+        wallet_address = wallet.get('address')
+        if wallet_address and not is_address(wallet_address):
             errors.append(f"Invalid wallet address: {wallet_address}")
         
         # Validate network configuration
-        valid_networks = ['ARBITRUM_ONE', 'ARBITRUM_NOVA', 'ARBITRUM_SEPOLIA', 'BERACHAIN']
-        network = self.get('network.name')
-        if network not in valid_networks:
+        network = network_config.get('name')
+        if network not in _VALID_NETWORKS:
             errors.append(
                 f"Invalid network: {network}. "
-                f"Valid options: {', '.join(valid_networks)}"
+                f"Valid options: {', '.join(NETWORKS)}"
             )
         
         # Validate contract configuration
-        contract_address = self.get('contract.address')
+        contract_address = contract.get('address')
         if not contract_address:
             errors.append("contract.address is required")
-        elif not validate_ethereum_address(contract_address):
+        elif not is_address(contract_address):
             errors.append(f"Invalid contract address: {contract_address}")
         
         # Check that we have either ABI path or API key
-        if not self.get('contract.abi_path') and not self.get('contract.explorer_api_key'):
+        if not contract.get('abi_path') and not contract.get('explorer_api_key'):
             errors.append(
                 "Either contract.abi_path or contract.explorer_api_key must be provided"
             )
         
         # Validate minting configuration
-        amount = self.get('minting.amount')
+        amount = minting.get('amount')
         if amount < -1 or amount == 0:
             errors.append("minting.amount must be -1 (for max) or greater than 0")
         
-        group_id = self.get('minting.group_id')
+        group_id = minting.get('group_id')
         if group_id < 0:
             errors.append("minting.group_id must be non-negative")
         
-        to_address = self.get('minting.to_address')
+        to_address = minting.get('to_address')
         if to_address and to_address != 'DEFAULT':
-            if not validate_ethereum_address(to_address):
+            if not is_address(to_address):
                 errors.append(f"Invalid minting.to_address: {to_address}")
         
         # Raise all errors if any
@@ -231,6 +278,7 @@ class ConfigManager:
                 "Configuration validation failed:\n" + "\n".join(f"  - {e}" for e in errors)
             )
         
+        self._validated_fingerprint = fingerprint
         self.logger.info("Configuration validation passed")
     
     def get(self, key: str, default: Any = None) -> Any:
@@ -246,13 +294,14 @@ class ConfigManager:
         Returns:
             Configuration value or default
         """
-        try:
-            value = self.data
-            for part in key.split('.'):
-                value = value[part]
-            return value
-        except (KeyError, TypeError):
-            return default
+        value = self.data
+        for part in _split_key(key):
+            if not isinstance(value, dict):
+                return default
+            value = value.get(part, _MISSING)
+            if value is _MISSING:
+                return default
+        return value
     
     def set(self, key: str, value: Any):
         """
@@ -264,16 +313,16 @@ class ConfigManager:
         """
         self._set_nested(self.data, key, value)
     
-    def _set_nested(self, data: dict, key: str, value: Any):
+    def _set_nested(self, data: dict, key: Union[str, tuple], value: Any):
         """
         Set a nested dictionary value using dot notation.
         
         Args:
             data: Dictionary to modify
-            key: Dot-separated key
+            key: Dot-separated key or pre-split tuple of key parts
             value: Value to set
         """
-        parts = key.split('.')
+        parts = key if isinstance(key, tuple) else _split_key(key)
         current = data
         
         for part in parts[:-1]:
@@ -285,17 +334,36 @@ class ConfigManager:
     
     def _merge_config(self, base: dict, override: dict):
         """
-        Recursively merge override config into base config.
+        Merge override config into base config in place.
+        
+        Nested dictionaries are merged level by level using an explicit
+        stack of (base, override) pairs; any other value replaces the base.
         
         Args:
             base: Base configuration dictionary
             override: Override configuration dictionary
         """
-        for key, value in override.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._merge_config(base[key], value)
-            else:
-                base[key] = value
+        stack = [(base, override)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    target[key] = value
+    
+    def _default_config(self) -> dict:
+        """
+        Create a fresh copy of the default configuration.
+        
+        DEFAULT_CONFIG is one level of sections holding scalar values, so
+        copying each section dict is enough.
+        
+        Returns:
+            dict: Copy of DEFAULT_CONFIG
+        """
+        return {section: dict(values) for section, values in self.DEFAULT_CONFIG.items()}
     
     def _deep_copy(self, obj: Any) -> Any:
         """
@@ -321,18 +389,19 @@ class ConfigManager:
         Returns:
             dict: Sanitized configuration
         """
-        config = self._deep_copy(self.data)
+        # Shallow overlay: only the two redacted sections are copied
+        config = dict(self.data)
         
         # Hide sensitive values
-        if 'wallet' in config and 'private_key' in config['wallet']:
-            key = config['wallet']['private_key']
-            if key:
-                config['wallet']['private_key'] = f"{key[:6]}...{key[-4:]}"
+        wallet = config.get('wallet')
+        if isinstance(wallet, dict) and wallet.get('private_key'):
+            key = wallet['private_key']
+            config['wallet'] = {**wallet, 'private_key': f"{key[:6]}...{key[-4:]}"}
         
-        if 'contract' in config and 'explorer_api_key' in config['contract']:
-            key = config['contract']['explorer_api_key']
-            if key:
-                config['contract']['explorer_api_key'] = f"{key[:4]}...{key[-4:]}"
+        contract = config.get('contract')
+        if isinstance(contract, dict) and contract.get('explorer_api_key'):
+            key = contract['explorer_api_key']
+            config['contract'] = {**contract, 'explorer_api_key': f"{key[:4]}...{key[-4:]}"}
         
         return config
     
@@ -345,14 +414,13 @@ class ConfigManager:
         """
         example_path = Path(path) if path else Path("config.example.json")
         
-        example_config = self._deep_copy(self.DEFAULT_CONFIG)
+        example_config = self._default_config()
         example_config['wallet']['private_key'] = "YOUR_PRIVATE_KEY_HERE"
         example_config['wallet']['address'] = "YOUR_WALLET_ADDRESS_HERE"
         example_config['contract']['address'] = "CONTRACT_ADDRESS_HERE"
         example_config['contract']['abi_path'] = "path/to/contract_abi.json"
         example_config['contract']['explorer_api_key'] = "YOUR_API_KEY_HERE"
         
-        with open(example_path, 'w') as f:
-            json.dump(example_config, f, indent=2)
+        save_json_file(example_config, example_path)
         
         self.logger.info(f"Saved example configuration to {example_path}")
\ No newline at end of file
@@ -8,54 +8,54 @@ application for better error handling and debugging.
 
 class MinterError(Exception):
     """Base exception class for all minter-related errors."""
-    pass
+    __slots__ = ()
 
 
 class ConfigurationError(MinterError):
     """Raised when there are issues with configuration."""
-    pass
+    __slots__ = ()
 
 
 class ConnectionError(MinterError):
     """Raised when there are network connection issues."""
-    pass
+    __slots__ = ()
 
 
 class ContractError(MinterError):
     """Raised when there are issues with smart contract interactions."""
-    pass
+    __slots__ = ()
 
 
 class TransactionError(MinterError):
     """Raised when a blockchain transaction fails."""
-    pass
+    __slots__ = ()
 
 
 class ValidationError(MinterError):
     """Raised when input validation fails."""
-    pass
+    __slots__ = ()
 
 
 class InsufficientFundsError(TransactionError):
     """Raised when wallet has insufficient funds for transaction."""
-    pass
+    __slots__ = ()
 
 
 class GasEstimationError(TransactionError):
     """Raised when gas estimation fails."""
-    pass
+    __slots__ = ()
 
 
 class ABIError(ContractError):
     """Raised when there are issues with contract ABI."""
-    pass
+    __slots__ = ()
 
 
 class MintNotLiveError(ContractError):
     """Raised when attempting to mint while minting is not live."""
-    pass
+    __slots__ = ()
 
 
 class MintLimitExceededError(ContractError):
     """Raised when mint amount exceeds allowed limit."""
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
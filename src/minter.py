@@ -6,14 +6,25 @@ interactions for minting NFTs. It provides methods for connecting to networks,
 loading contracts, monitoring mint status, and executing batch mints.
 """
 
+import asyncio
+import random
 import time
 import logging
-from typing import Dict, Any, Optional, Union
-from web3 import Web3
-from web3.exceptions import ContractLogicError
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Callable, List, Optional, Union
+import requests
+from requests.adapters import HTTPAdapter
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3, WebSocketProvider
+from web3.datastructures import AttributeDict
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError, TransactionNotFound
+from eth_abi.exceptions import DecodingError
 from eth_account import Account
+from eth_utils import function_signature_to_4byte_selector
 
-from .networks import get_network_config, get_block_explorer_url
+from .networks import (
+    get_network_config, get_block_explorer_url, get_rpc_endpoints,
+    get_network_by_chain_id, validate_chain_id
+)
 from .exceptions import (
     ConnectionError, ContractError, TransactionError, 
     MinterError, ConfigurationError
@@ -21,6 +32,38 @@ from .exceptions import (
 from .utils import load_abi_from_file, get_contract_abi_from_explorer
 
 
+# Multicall3 is deployed at the same address on most EVM chains
+MULTICALL3_ADDRESS = '0xcA11bde05977b3631167028862bE2a173976CA11'
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"}
+                ],
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"}
+                ],
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    }
+]
+
+
 class NFTMinter:
     """
     Main class for interacting with NFT smart contracts and performing mints.
@@ -29,6 +72,28 @@ class NFTMinter:
     loading contracts, monitoring mint status, and executing batch mint transactions.
     """
     
+    # Contract info fields: (result key, contract function, value if missing)
+    CONTRACT_INFO_FUNCTIONS = (
+        ('total_supply', 'totalSupply', 'N/A'),
+        ('max_supply', 'maxSupply', 'N/A'),
+        ('mint_live', 'mintLive', True),  # Assume live if no check function
+    )
+    
+    # Seconds a fetched gas price is reused for new transactions
+    GAS_PRICE_TTL = 2.0
+    
+    # RPC request timeout in seconds
+    RPC_TIMEOUT = 30
+    
+    # Timeout in seconds for each endpoint probe when ranking RPCs
+    RPC_PROBE_TIMEOUT = 3
+    
+    # Hex quantity fields decoded to int in raw batched receipts
+    RECEIPT_QUANTITY_FIELDS = (
+        'blockNumber', 'cumulativeGasUsed', 'effectiveGasPrice',
+        'gasUsed', 'status', 'transactionIndex', 'type'
+    )
+    
     def __init__(self, config, dry_run: bool = False):
         """
         Initialize the NFT Minter with configuration.
@@ -46,6 +111,13 @@ class NFTMinter:
         self.contract = None
         self.account = None
         
+        # Candidate RPC endpoints, best first, and the one in use
+        self.rpc_pool = []
+        self.rpc_url = None
+        
+        # AsyncWeb3 view of the contract, created on first async use
+        self._async_contract = None
+        
         # Transaction tracking
         self.nonce = None
         self.last_tx_hash = None
@@ -54,6 +126,25 @@ class NFTMinter:
         self.network_config = None
         self.chain_id = None
         
+        # Last fetched gas price as (monotonic timestamp, wei)
+        self._gas_price_cache = None
+        
+        # Buffered gas limits keyed by (to_address, group_id, amount)
+        self._gas_limits = {}
+        
+        # Multicall3 contract, and False once it proved unusable on this network
+        self._multicall_contract = None
+        self._multicall_supported = True
+        
+        # Checksummed forms of addresses already normalized
+        self._checksum_cache = {}
+        
+        # Function names and argument counts from the contract ABI, and the resolved mint function
+        self._function_names = None
+        self._function_arities = None
+        self._mint_function_name = None
+        self._mint_live_calldata = None
+        
     def connect(self):
         """
         Connect to the blockchain network.
@@ -67,25 +158,114 @@ class NFTMinter:
         
         self.network_config = get_network_config(network_name)
         
-        # Use custom RPC if provided, otherwise use default
-        rpc_url = custom_rpc or self.network_config['rpc']
-        
-        self.logger.debug(f"Connecting to {network_name} at {rpc_url}")
-        
-        # Initialize Web3
-        self.web3 = Web3(Web3.HTTPProvider(rpc_url))
+        # Use custom RPC if provided, otherwise the default or the fastest endpoint
+        if custom_rpc:
+            self.rpc_pool = [custom_rpc]
+        elif self.config.get('network.rpc_failover'):
+            self.rpc_pool = self._rank_rpc_endpoints(network_name)
+        else:
+            self.rpc_pool = [self.network_config['rpc']]
         
-        # Check connection
-        if not self.web3.is_connected():
-            raise ConnectionError(f"Failed to connect to {network_name} at {rpc_url}")
+        # Connect to the first endpoint in the pool that responds
+        for rpc_url in self.rpc_pool:
+            self.rpc_url = rpc_url
+            self.logger.debug("Connecting to %s at %s", network_name, rpc_url)
+            
+            # Initialize Web3 over a persistent, pooled HTTP session
+            self.web3 = Web3(Web3.HTTPProvider(
+                rpc_url,
+                session=self._create_http_session(),
+                request_kwargs={'timeout': self.RPC_TIMEOUT}
+            ))
+            
+            if self.web3.is_connected():
+                break
+            self.logger.warning("Failed to connect to %s at %s", network_name, rpc_url)
+        else:
+            raise ConnectionError(f"Failed to connect to {network_name} at {self.rpc_url}")
         
         # Get chain ID
         self.chain_id = self.web3.eth.chain_id
-        self.logger.info(f"Connected to {network_name} (Chain ID: {self.chain_id})")
+        self.logger.info("Connected to %s (Chain ID: %s)", network_name, self.chain_id)
+        
+        # Never sign for a different chain than the configured one
+        if not validate_chain_id(network_name, self.chain_id):
+            raise ConnectionError(
+                f"RPC chain ID {self.chain_id} doesn't match {network_name} "
+                f"(connected network: {get_network_by_chain_id(self.chain_id) or 'unknown'})"
+            )
         
         # Initialize account
         self._initialize_account()
         
+    def _rank_rpc_endpoints(self, network_name: str) -> List[str]:
+        """
+        Probe all known RPC endpoints in parallel and rank them by response time.
+        
+        Each endpoint is asked for eth_chainId; endpoints that answer with the
+        expected chain ID come first, fastest first, followed by those whose
+        probe failed in their configured order. Endpoints that report another
+        chain ID are left out.
+        
+        Args:
+            network_name: Name of the network
+            
+        Returns:
+            list: RPC endpoint URLs, best first
+            
+        Raises:
+            ConnectionError: If every endpoint reports another chain ID
+        """
+        # Skip template entries that need a project ID or API key
+        endpoints = [url for url in get_rpc_endpoints(network_name) if 'YOUR-' not in url]
+        expected_chain_id = self.network_config['chain_id']
+        payload = {"jsonrpc": "2.0", "id": 1, "method": "eth_chainId", "params": []}
+        
+        def probe(url):
+            response = requests.post(url, json=payload, timeout=self.RPC_PROBE_TIMEOUT)
+            response.raise_for_status()
+            return int(response.json()['result'], 16)
+        
+        ranked = []
+        unavailable = set()
+        with ThreadPoolExecutor(max_workers=len(endpoints) or 1) as executor:
+            futures = {executor.submit(probe, url): url for url in endpoints}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    chain_id = future.result()
+                except Exception as e:
+                    self.logger.debug("RPC endpoint %s unavailable: %s", url, e)
+                    unavailable.add(url)
+                    continue
+                if chain_id == expected_chain_id:
+                    ranked.append(url)
+                else:
+                    self.logger.warning("RPC endpoint %s reports chain ID %s, skipping", url, chain_id)
+        
+        ranked.extend(url for url in endpoints if url in unavailable)
+        if not ranked:
+            raise ConnectionError(
+                f"No RPC endpoint for {network_name} reports chain ID {expected_chain_id}"
+            )
+        self.logger.debug("Ranked RPC endpoints: %s", ranked)
+        return ranked
+        
+    @staticmethod
+    def _create_http_session() -> requests.Session:
+        """
+        Create an HTTP session that keeps RPC connections alive between requests.
+        
+        Returns:
+            requests.Session: Session with a connection pool mounted for HTTP(S)
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers['Connection'] = 'keep-alive'
+        return session
+        
     def _initialize_account(self):
         """
         Initialize the wallet account from private key.
@@ -104,21 +284,35 @@ class NFTMinter:
         
         try:
             self.account = Account.from_key(private_key)
-            self.logger.info(f"Initialized wallet: {self.account.address}")
+            self.logger.info("Initialized wallet: %s", self.account.address)
             
             # Verify address matches configuration
             config_address = self.config.get('wallet.address')
             if config_address and config_address.lower() != self.account.address.lower():
                 self.logger.warning(
-                    f"Configured address {config_address} doesn't match "
-                    f"derived address {self.account.address}"
+                    "Configured address %s doesn't match derived address %s",
+                    config_address, self.account.address
                 )
         except Exception as e:
             raise ConfigurationError(f"Invalid private key: {str(e)}")
         
         # Get initial nonce
         self.nonce = self.web3.eth.get_transaction_count(self.account.address)
-        self.logger.debug(f"Current nonce: {self.nonce}")
+        self.logger.debug("Current nonce: %s", self.nonce)
+        
+    def refresh_nonce(self) -> int:
+        """
+        Re-read the account nonce from the network, including pending transactions.
+        
+        Returns:
+            int: The refreshed nonce
+        """
+        if not self.web3 or not self.account:
+            raise MinterError("Not connected to network")
+        
+        self.nonce = self.web3.eth.get_transaction_count(self.account.address, 'pending')
+        self.logger.debug("Refreshed nonce: %s", self.nonce)
+        return self.nonce
         
     def load_contract(self):
         """
@@ -136,7 +330,7 @@ class NFTMinter:
             raise ContractError("Contract address not provided in configuration")
         
         # Ensure contract address is checksummed
-        contract_address = Web3.to_checksum_address(contract_address)
+        contract_address = self._checksum(contract_address)
         
         # Load ABI
         abi = self._load_contract_abi()
@@ -147,10 +341,85 @@ class NFTMinter:
                 address=contract_address,
                 abi=abi
             )
-            self.logger.info(f"Loaded contract at {contract_address}")
+            self.logger.info("Loaded contract at %s", contract_address)
         except Exception as e:
             raise ContractError(f"Failed to load contract: {str(e)}")
         
+        # Scan the ABI once so function lookups don't go through web3's attribute resolution
+        # (entries without 'inputs' leave the argument count unchecked)
+        arities = {}
+        for entry in abi:
+            if entry.get('type', 'function') == 'function' and 'name' in entry:
+                counts = arities.setdefault(entry['name'], set())
+                counts.add(len(entry['inputs']) if 'inputs' in entry else None)
+        self._function_arities = {
+            name: None if None in counts else frozenset(counts)
+            for name, counts in arities.items()
+        }
+        self._function_names = frozenset(arities)
+        self._mint_function_name = None
+        
+        # Precomputed calldata for polling mintLive() with a raw eth_call
+        self._mint_live_calldata = None
+        if any(
+            entry.get('name') == 'mintLive' and not entry.get('inputs')
+            and [output.get('type') for output in entry.get('outputs', ())] == ['bool']
+            for entry in abi
+        ):
+            self._mint_live_calldata = '0x' + function_signature_to_4byte_selector('mintLive()').hex()
+        self._async_contract = None
+        self._gas_limits = {}
+        self._multicall_supported = True
+        
+    def _has_function(self, name: str) -> bool:
+        """
+        Check whether the loaded contract exposes a function.
+        
+        Args:
+            name: Function name
+            
+        Returns:
+            bool: True if the contract has the function
+        """
+        if self._function_names is not None:
+            return name in self._function_names
+        return hasattr(self.contract.functions, name)
+        
+    def _accepts(self, name: str, args: list) -> bool:
+        """
+        Check whether a contract function can be called with the given arguments.
+        
+        Only the argument count is checked, and only when the ABI was scanned
+        by load_contract(); otherwise any function that exists is accepted.
+        
+        Args:
+            name: Function name
+            args: Call arguments
+            
+        Returns:
+            bool: True if the function exists and takes that many arguments
+        """
+        if not self._has_function(name):
+            return False
+        arities = self._function_arities.get(name) if self._function_arities is not None else None
+        return arities is None or len(args) in arities
+        
+    def _checksum(self, address: str) -> str:
+        """
+        Get the EIP-55 checksummed form of an address, computing it only once.
+        
+        Args:
+            address: Hex address in any case
+            
+        Returns:
+            str: Checksummed address
+        """
+        checksummed = self._checksum_cache.get(address)
+        if checksummed is None:
+            checksummed = Web3.to_checksum_address(address)
+            self._checksum_cache[address] = checksummed
+        return checksummed
+        
     def _load_contract_abi(self) -> list:
         """
         Load contract ABI from file or block explorer.
@@ -166,10 +435,10 @@ class NFTMinter:
         if abi_path:
             try:
                 abi = load_abi_from_file(abi_path)
-                self.logger.info(f"Loaded ABI from file: {abi_path}")
+                self.logger.info("Loaded ABI from file: %s", abi_path)
                 return abi
             except Exception as e:
-                self.logger.warning(f"Failed to load ABI from file: {e}")
+                self.logger.warning("Failed to load ABI from file: %s", e)
         
         # Try fetching from block explorer
         api_key = self.config.get('contract.explorer_api_key')
@@ -189,17 +458,193 @@ class NFTMinter:
                 self.logger.info("Loaded ABI from block explorer")
                 return abi
             except Exception as e:
-                self.logger.warning(f"Failed to fetch ABI from explorer: {e}")
+                self.logger.warning("Failed to fetch ABI from explorer: %s", e)
         
         raise ContractError(
             "Could not load contract ABI. Please provide either 'abi_path' "
             "or 'explorer_api_key' in configuration."
         )
         
+    def _batch_call(self, calls: List[Callable[[], Any]]) -> List[Any]:
+        """
+        Execute several read requests in a single JSON-RPC batch.
+        
+        Each request is a callable returning either a web3 method call
+        (e.g. ``lambda: self.web3.eth.get_balance(addr)``) or a contract
+        function such as ``contract.functions.totalSupply()``. If the provider
+        does not support batching, the requests are executed one by one.
+        
+        Args:
+            calls: Callables producing the requests to execute
+            
+        Returns:
+            list: Results in the same order as the requests
+        """
+        try:
+            with self.web3.batch_requests() as batch:
+                for call in calls:
+                    batch.add(call())
+                return list(batch.execute())
+        except Exception as e:
+            self.logger.debug("JSON-RPC batch failed, using sequential calls: %s", e)
+        
+        results = []
+        for call in calls:
+            result = call()
+            if hasattr(result, 'call'):
+                result = result.call()
+            results.append(result)
+        return results
+    
+    def _multicall(self, calls: List[tuple]) -> List[tuple]:
+        """
+        Execute several contract read calls in a single Multicall3 eth_call.
+        
+        Individual calls are allowed to fail without failing the whole batch.
+        
+        Args:
+            calls: (function name, args) pairs for the loaded contract
+            
+        Returns:
+            list: (success, value) pairs in the same order as the calls
+            
+        Raises:
+            BadFunctionCallOutput: If Multicall3 returned no data (not deployed)
+            DecodingError: If the Multicall3 result can't be decoded
+            Exception: If the eth_call itself fails (e.g. an RPC timeout)
+        """
+        if self._multicall_contract is None:
+            self._multicall_contract = self.web3.eth.contract(
+                address=MULTICALL3_ADDRESS,
+                abi=MULTICALL3_ABI
+            )
+        
+        # Calls that can't be encoded (e.g. wrong number of args) simply fail
+        functions = []
+        call3 = []
+        for name, args in calls:
+            try:
+                function = getattr(self.contract.functions, name)(*args)
+                call3.append((self.contract.address, True, self.contract.encode_abi(name, args=args)))
+            except Exception:
+                function = None
+            functions.append(function)
+        
+        results = iter(self._multicall_contract.functions.aggregate3(call3).call() if call3 else ())
+        
+        decoded = []
+        for function in functions:
+            if function is None:
+                decoded.append((False, None))
+                continue
+            success, return_data = next(results)
+            if not success:
+                decoded.append((False, None))
+                continue
+            output_types = [output['type'] for output in function.abi.get('outputs', [])]
+            try:
+                values = list(self.web3.codec.decode(output_types, return_data))
+            except DecodingError:
+                # The target's return data is bad, not Multicall3 itself
+                decoded.append((False, None))
+                continue
+            decoded.append((True, values[0] if len(values) == 1 else values))
+        return decoded
+    
+    def _probe_calls(self, candidates: List[tuple]):
+        """
+        Yield the results of candidate contract calls that succeed, in order.
+        
+        All candidates are tried in one Multicall3 request when possible;
+        otherwise they are called one at a time, lazily, so a consumer that
+        stops at the first result only pays for the calls it needed.
+        Multicall3 is only disabled for later probes when its response shows
+        it is unsupported; other failures fall back for this probe alone.
+        
+        Args:
+            candidates: (function name, args) pairs, in order of preference
+            
+        Yields:
+            tuple: (function name, result) for each successful call
+        """
+        if not candidates:
+            return
+        
+        if self._multicall_supported:
+            try:
+                results = self._multicall(candidates)
+            except (BadFunctionCallOutput, DecodingError) as e:
+                self.logger.debug("Multicall3 unsupported, using sequential calls: %s", e)
+                self._multicall_supported = False
+            except Exception as e:
+                self.logger.debug("Multicall3 call failed, using sequential calls: %s", e)
+            else:
+                for (func_name, _), (success, value) in zip(candidates, results):
+                    if success:
+                        yield func_name, value
+                return
+        
+        for func_name, args in candidates:
+            try:
+                result = getattr(self.contract.functions, func_name)(*args).call()
+            except Exception as e:
+                self.logger.debug("Failed to call %s: %s", func_name, e)
+                continue
+            yield func_name, result
+    
+    def get_startup_state(self) -> Dict[str, Any]:
+        """
+        Get contract information, wallet balance and gas price at once.
+        
+        All values are fetched in one JSON-RPC batch, so only a single
+        round-trip to the RPC node is needed.
+        
+        Returns:
+            dict: Contract information as returned by get_contract_info(),
+                plus 'balance' (in ETH) and 'gas_price' (in wei)
+            
+        Raises:
+            ContractError: If contract calls fail
+        """
+        if not self.contract:
+            raise ContractError("Contract not loaded")
+        if not self.web3 or not self.account:
+            raise MinterError("Not connected to network")
+        
+        info_functions = [
+            (key, name) for key, name, _ in self.CONTRACT_INFO_FUNCTIONS
+            if self._has_function(name)
+        ]
+        calls = [
+            lambda: self.web3.eth.get_balance(self.account.address),
+            lambda: self.web3.eth.gas_price,
+        ] + [
+            (lambda name=name: getattr(self.contract.functions, name)())
+            for _, name in info_functions
+        ]
+        
+        try:
+            results = self._batch_call(calls)
+        except Exception as e:
+            raise ContractError(f"Failed to get contract info: {str(e)}")
+        
+        balance_wei, gas_price = results[0], results[1]
+        info = {key: default for key, _, default in self.CONTRACT_INFO_FUNCTIONS}
+        for (key, _), value in zip(info_functions, results[2:]):
+            info[key] = value
+        
+        info['balance'] = float(self.web3.from_wei(balance_wei, 'ether'))
+        info['gas_price'] = gas_price
+        self._gas_price_cache = (time.monotonic(), gas_price)
+        return info
+    
     def get_contract_info(self) -> Dict[str, Any]:
         """
         Get information about the NFT contract.
         
+        The contract calls are sent in one JSON-RPC batch when the provider
+        supports it.
+        
         Returns:
             dict: Contract information including supply and mint status
             
@@ -209,31 +654,24 @@ class NFTMinter:
         if not self.contract:
             raise ContractError("Contract not loaded")
         
+        info_functions = [
+            (key, name) for key, name, _ in self.CONTRACT_INFO_FUNCTIONS
+            if self._has_function(name)
+        ]
+        
         try:
-            info = {}
-            
-            # Get total supply
-            if hasattr(self.contract.functions, 'totalSupply'):
-                info['total_supply'] = self.contract.functions.totalSupply().call()
-            else:
-                info['total_supply'] = 'N/A'
-            
-            # Get max supply
-            if hasattr(self.contract.functions, 'maxSupply'):
-                info['max_supply'] = self.contract.functions.maxSupply().call()
-            else:
-                info['max_supply'] = 'N/A'
-            
-            # Check if mint is live
-            if hasattr(self.contract.functions, 'mintLive'):
-                info['mint_live'] = self.contract.functions.mintLive().call()
-            else:
-                info['mint_live'] = True  # Assume live if no check function
-            
-            return info
-            
+            results = self._batch_call([
+                (lambda name=name: getattr(self.contract.functions, name)())
+                for _, name in info_functions
+            ])
         except Exception as e:
             raise ContractError(f"Failed to get contract info: {str(e)}")
+        
+        info = {key: default for key, _, default in self.CONTRACT_INFO_FUNCTIONS}
+        for (key, _), value in zip(info_functions, results):
+            info[key] = value
+        
+        return info
     
     def get_wallet_balance(self) -> float:
         """
@@ -254,8 +692,12 @@ class NFTMinter:
         """
         Wait for minting to go live.
         
+        When 'network.ws_rpc' is configured this waits for new blocks
+        instead of polling (see wait_for_mint_live_async()).
+        
         Args:
-            check_interval: Seconds between checks
+            check_interval: Longest delay in seconds between checks; polling
+                starts at the network's block time and backs off to this
             timeout: Maximum seconds to wait
             
         Raises:
@@ -265,26 +707,32 @@ class NFTMinter:
             raise ContractError("Contract not loaded")
         
         # Check if contract has mintLive function
-        if not hasattr(self.contract.functions, 'mintLive'):
+        if not self._has_function('mintLive'):
             self.logger.warning("Contract doesn't have mintLive function, proceeding anyway")
             return
         
-        start_time = time.time()
+        # Follow new blocks instead of polling when a websocket RPC is configured
+        if self.config.get('network.ws_rpc'):
+            asyncio.run(self.wait_for_mint_live_async(check_interval, timeout))
+            return
+        
+        deadline = time.monotonic() + timeout
+        intervals = self._poll_intervals(check_interval)
         
         while True:
             try:
-                is_live = self.contract.functions.mintLive().call()
+                is_live = self._call_mint_live()
                 
                 if is_live:
                     self.logger.info("Minting is now LIVE!")
                     return
                 
-                elapsed = time.time() - start_time
-                if elapsed > timeout:
+                if time.monotonic() > deadline:
                     raise ContractError(f"Timeout waiting for mint to go live ({timeout}s)")
                 
-                self.logger.debug(f"Mint not live yet, checking again in {check_interval}s...")
-                time.sleep(check_interval)
+                interval = next(intervals)
+                self.logger.debug("Mint not live yet, checking again in %.2fs...", interval)
+                time.sleep(interval)
                 
             except Exception as e:
                 if "mintLive" in str(e):
@@ -292,9 +740,169 @@ class NFTMinter:
                     return
                 raise ContractError(f"Error checking mint status: {str(e)}")
     
+    def _poll_intervals(self, check_interval: float):
+        """
+        Yield the delays between mintLive polls.
+        
+        Polling starts at the network's block time and doubles after every
+        check up to check_interval, with +/-10% jitter so that several
+        minters don't poll the RPC in lockstep.
+        
+        Args:
+            check_interval: Longest delay in seconds
+            
+        Yields:
+            float: Seconds to wait before the next check
+        """
+        block_time = (self.network_config or {}).get('block_time_ms')
+        interval = check_interval if block_time is None else min(block_time / 1000, check_interval)
+        
+        while True:
+            yield interval * random.uniform(0.9, 1.1)
+            interval = min(interval * 2, check_interval)
+    
+    def _call_mint_live(self) -> bool:
+        """
+        Read mintLive() once.
+        
+        When the ABI confirms the plain ``mintLive() returns (bool)``
+        signature, the call is sent as a raw eth_call with precomputed
+        calldata, skipping web3's ABI encoding and decoding.
+        
+        Returns:
+            bool: True if minting is live
+        """
+        if self._mint_live_calldata is None:
+            return self.contract.functions.mintLive().call()
+        
+        result = self.web3.eth.call({
+            'to': self.contract.address,
+            'data': self._mint_live_calldata
+        })
+        if len(result) < 32:
+            raise ValueError(f"Could not decode mintLive() return data: {result!r}")
+        return int.from_bytes(result[-32:], 'big') != 0
+    
+    def _get_async_contract(self):
+        """
+        Get an AsyncWeb3 contract bound to the same RPC endpoint and ABI.
+        
+        Returns:
+            AsyncContract: Contract for use with await
+            
+        Raises:
+            ContractError: If the contract is not loaded
+        """
+        if not self.contract:
+            raise ContractError("Contract not loaded")
+        
+        if self._async_contract is None:
+            async_web3 = AsyncWeb3(AsyncHTTPProvider(
+                self.rpc_url,
+                request_kwargs={'timeout': self.RPC_TIMEOUT}
+            ))
+            self._async_contract = async_web3.eth.contract(
+                address=self.contract.address,
+                abi=self.contract.abi
+            )
+        
+        return self._async_contract
+    
+    async def wait_for_mint_live_async(self, check_interval: float = 10, timeout: float = 3600):
+        """
+        Wait for minting to go live without blocking the event loop.
+        
+        Behaves like wait_for_mint_live(), but polls through AsyncWeb3, so
+        several minters can wait concurrently, e.g. with asyncio.gather().
+        When 'network.ws_rpc' is configured, mintLive is re-checked once per
+        new block (newHeads subscription) instead of every check_interval
+        seconds, falling back to polling if the subscription fails.
+        
+        Args:
+            check_interval: Longest delay in seconds between checks when polling
+            timeout: Maximum seconds to wait
+            
+        Raises:
+            ContractError: If mint doesn't go live within timeout
+        """
+        if not self.contract:
+            raise ContractError("Contract not loaded")
+        
+        if not self._has_function('mintLive'):
+            self.logger.warning("Contract doesn't have mintLive function, proceeding anyway")
+            return
+        
+        deadline = time.monotonic() + timeout
+        
+        ws_rpc = self.config.get('network.ws_rpc')
+        if ws_rpc:
+            try:
+                await asyncio.wait_for(self._wait_for_new_heads(ws_rpc), timeout)
+                return
+            except asyncio.TimeoutError:
+                raise ContractError(f"Timeout waiting for mint to go live ({timeout}s)")
+            except ContractError:
+                raise
+            except Exception as e:
+                self.logger.warning("Block subscription failed (%s), falling back to polling", e)
+        
+        contract = self._get_async_contract()
+        intervals = self._poll_intervals(check_interval)
+        
+        while not await self._is_mint_live_async(contract):
+            if time.monotonic() > deadline:
+                raise ContractError(f"Timeout waiting for mint to go live ({timeout}s)")
+            
+            interval = next(intervals)
+            self.logger.debug("Mint not live yet, checking again in %.2fs...", interval)
+            await asyncio.sleep(interval)
+    
+    async def _wait_for_new_heads(self, ws_rpc: str):
+        """
+        Re-check mintLive on every new block header until minting is live.
+        
+        Args:
+            ws_rpc: Websocket RPC endpoint
+        """
+        async with AsyncWeb3(WebSocketProvider(ws_rpc)) as w3:
+            contract = w3.eth.contract(address=self.contract.address, abi=self.contract.abi)
+            await w3.eth.subscribe('newHeads')
+            self.logger.info("Subscribed to new blocks via %s", ws_rpc)
+            
+            if await self._is_mint_live_async(contract):
+                return
+            async for _ in w3.socket.process_subscriptions():
+                if await self._is_mint_live_async(contract):
+                    return
+    
+    async def _is_mint_live_async(self, contract) -> bool:
+        """
+        Check mintLive once through an async contract.
+        
+        Args:
+            contract: AsyncWeb3 contract
+            
+        Returns:
+            bool: True if minting is live (or can't be checked), False otherwise
+            
+        Raises:
+            ContractError: If the check fails
+        """
+        try:
+            is_live = await contract.functions.mintLive().call()
+        except Exception as e:
+            if "mintLive" in str(e):
+                self.logger.warning("Error checking mint status, proceeding anyway")
+                return True
+            raise ContractError(f"Error checking mint status: {str(e)}")
+        
+        if is_live:
+            self.logger.info("Minting is now LIVE!")
+        return bool(is_live)
+    
     def mint(self) -> Optional[str]:
         """
-        Execute the minting transaction.
+        Execute the minting transaction and wait for its confirmation.
         
         Returns:
             str: Transaction hash if successful, None if dry run
@@ -302,6 +910,138 @@ class NFTMinter:
         Raises:
             TransactionError: If transaction fails
         """
+        to_address, group_id, amount = self._resolve_mint_params()
+        
+        if self.dry_run:
+            self.logger.info("DRY RUN - Transaction not executed")
+            return None
+        
+        # Build and send transaction
+        tx_hash = self._execute_mint_transaction(
+            to_address, group_id, amount
+        )
+        
+        return tx_hash
+    
+    def submit_mint(self) -> Optional[str]:
+        """
+        Send the minting transaction without waiting for confirmation.
+        
+        The local nonce is advanced as soon as the transaction is sent, so
+        several mints can be in flight at once. Use await_receipt() or
+        get_transaction_receipts() to check the outcome.
+        
+        Returns:
+            str: Transaction hash, None if dry run
+            
+        Raises:
+            TransactionError: If the transaction cannot be sent
+        """
+        to_address, group_id, amount = self._resolve_mint_params()
+        
+        if self.dry_run:
+            self.logger.info("DRY RUN - Transaction not executed")
+            return None
+        
+        return self._send_mint_transaction(to_address, group_id, amount)
+    
+    def await_receipt(self, tx_hash: str, timeout: int = 300) -> Dict[str, Any]:
+        """
+        Wait for a transaction to be confirmed.
+        
+        Args:
+            tx_hash: Transaction hash
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            dict: Transaction receipt
+            
+        Raises:
+            TransactionError: If the transaction fails or is not confirmed in time
+        """
+        try:
+            self.logger.info("Waiting for transaction confirmation...")
+            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
+        except Exception as e:
+            raise TransactionError(f"Transaction failed: {str(e)}")
+        
+        # Check transaction status
+        if receipt['status'] == 0:
+            raise TransactionError("Transaction failed (status = 0)")
+        
+        self.logger.info("Transaction confirmed! Gas used: %s", receipt['gasUsed'])
+        return receipt
+    
+    def get_transaction_receipts(self, tx_hashes: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get the receipts of several transactions in one JSON-RPC batch.
+        
+        The batch is sent as raw eth_getTransactionReceipt requests, since
+        web3's formatted batch raises TransactionNotFound as soon as one
+        transaction is still pending. Quantity fields of batched receipts
+        are decoded to int; if the provider can't batch, the receipts are
+        fetched one by one.
+        
+        Args:
+            tx_hashes: Transaction hashes
+            
+        Returns:
+            list: Receipts in the same order, None for transactions not yet mined
+        """
+        try:
+            responses = self.web3.provider.make_batch_request(
+                [('eth_getTransactionReceipt', [tx_hash]) for tx_hash in tx_hashes]
+            )
+            if not isinstance(responses, list) or len(responses) != len(tx_hashes):
+                raise ValueError(f"unexpected batch response: {responses!r}")
+            return [self._decode_receipt(response) for response in responses]
+        except Exception as e:
+            self.logger.debug("Receipt batch failed, using sequential calls: %s", e)
+        
+        receipts = []
+        for tx_hash in tx_hashes:
+            try:
+                receipts.append(self.web3.eth.get_transaction_receipt(tx_hash))
+            except TransactionNotFound:
+                receipts.append(None)
+        return receipts
+    
+    def _decode_receipt(self, response: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Decode one raw eth_getTransactionReceipt batch response.
+        
+        Args:
+            response: JSON-RPC response object
+            
+        Returns:
+            AttributeDict: Receipt with quantity fields as int, or None if not yet mined
+            
+        Raises:
+            TransactionError: If the response carries a JSON-RPC error
+        """
+        if 'error' in response:
+            raise TransactionError(f"Receipt request failed: {response['error']}")
+        
+        receipt = response.get('result')
+        if receipt is None:
+            return None
+        
+        return AttributeDict({
+            key: int(value, 16)
+            if key in self.RECEIPT_QUANTITY_FIELDS and isinstance(value, str) else value
+            for key, value in receipt.items()
+        })
+    
+    def _resolve_mint_params(self):
+        """
+        Resolve the recipient, group and amount for the next mint.
+        
+        Returns:
+            tuple: (to_address, group_id, amount)
+            
+        Raises:
+            MinterError: If the minter is not initialized
+        """
         if not self.contract or not self.account:
             raise MinterError("Not initialized properly")
         
@@ -315,27 +1055,18 @@ class NFTMinter:
             to_address = self.account.address
         
         # Convert to checksum address
-        to_address = Web3.to_checksum_address(to_address)
+        to_address = self._checksum(to_address)
         
         # Check if we should mint max amount
         if amount == -1:
             amount = self._get_max_mint_amount(group_id)
-            self.logger.info(f"Auto-detected max mint amount: {amount}")
+            self.logger.info("Auto-detected max mint amount: %s", amount)
         
         self.logger.info(
-            f"Minting {amount} NFT(s) from group {group_id} to {to_address}"
-        )
-        
-        if self.dry_run:
-            self.logger.info("DRY RUN - Transaction not executed")
-            return None
-        
-        # Build and send transaction
-        tx_hash = self._execute_mint_transaction(
-            to_address, group_id, amount
+            "Minting %s NFT(s) from group %s to %s", amount, group_id, to_address
         )
         
-        return tx_hash
+        return to_address, group_id, amount
     
     def _get_max_mint_amount(self, group_id: int) -> int:
         """
@@ -350,21 +1081,17 @@ class NFTMinter:
         Raises:
             ContractError: If unable to determine max amount
         """
-        # Try different function names
+        # Try different function names, with a group_id parameter and without
         function_names = ['maxMintPerWallet', 'maxMint', 'maxMintAmount']
+        candidates = [
+            (func_name, params)
+            for func_name in function_names
+            for params in ([group_id], [])
+            if self._accepts(func_name, params)
+        ]
         
-        for func_name in function_names:
-            if hasattr(self.contract.functions, func_name):
-                try:
-                    func = getattr(self.contract.functions, func_name)
-                    # Try with group_id parameter
-                    try:
-                        return func(group_id).call()
-                    except:
-                        # Try without parameters
-                        return func().call()
-                except Exception as e:
-                    self.logger.debug(f"Failed to call {func_name}: {e}")
+        for _, result in self._probe_calls(candidates):
+            return result
         
         # Default to 1 if we can't determine
         self.logger.warning("Could not determine max mint amount, defaulting to 1")
@@ -390,38 +1117,125 @@ class NFTMinter:
         Raises:
             TransactionError: If transaction fails
         """
-        try:
-            # Build transaction
-            tx = self._build_mint_transaction(to_address, group_id, amount)
+        tx_hash = self._send_mint_transaction(to_address, group_id, amount)
+        self.await_receipt(tx_hash)
+        return tx_hash
+    
+    def _send_mint_transaction(
+        self, 
+        to_address: str, 
+        group_id: int, 
+        amount: int
+    ) -> str:
+        """
+        Build, sign and send the mint transaction.
+        
+        Args:
+            to_address: Recipient address
+            group_id: Token group/collection ID  
+            amount: Number of tokens to mint
             
-            # Sign transaction
-            signed_tx = self.web3.eth.account.sign_transaction(
-                tx, 
-                private_key=self.account.key
-            )
+        Returns:
+            str: Transaction hash
             
-            # Send transaction
-            self.logger.info("Sending transaction...")
-            tx_hash = self.web3.eth.send_raw_transaction(signed_tx.raw_transaction)
-            tx_hash_hex = tx_hash.hex()
+        Raises:
+            TransactionError: If the transaction cannot be sent
+        """
+        raw_transaction = self._sign_mint_transaction(to_address, group_id, amount)
+        try:
+            tx_hash_hex = self.send_signed_transaction(raw_transaction)
+        except TransactionError as e:
+            if 'nonce too low' not in str(e).lower():
+                raise
+            # The local nonce fell behind the network; resync and retry once
+            self.logger.warning("Nonce %s already used, resyncing with the network", self.nonce)
+            self.refresh_nonce()
+            raw_transaction = self._sign_mint_transaction(to_address, group_id, amount)
+            tx_hash_hex = self.send_signed_transaction(raw_transaction)
+        
+        # The nonce is consumed once the transaction is sent
+        self.nonce += 1
+        
+        return tx_hash_hex
+    
+    def sign_mint(self) -> Optional[bytes]:
+        """
+        Build and sign the minting transaction without sending it.
+        
+        The transaction uses the current local nonce, which is then advanced,
+        so several transactions can be signed ahead of time with sequential
+        nonces and sent later with send_signed_transaction().
+        
+        Returns:
+            bytes: Raw signed transaction, None if dry run
             
-            self.logger.info(f"Transaction sent! Hash: {tx_hash_hex}")
+        Raises:
+            TransactionError: If the transaction cannot be built or signed
+        """
+        to_address, group_id, amount = self._resolve_mint_params()
+        
+        if self.dry_run:
+            self.logger.info("DRY RUN - Transaction not signed")
+            return None
+        
+        raw_transaction = self._sign_mint_transaction(to_address, group_id, amount)
+        self.nonce += 1
+        
+        return raw_transaction
+    
+    def send_signed_transaction(self, raw_transaction: bytes) -> str:
+        """
+        Send an already signed transaction.
+        
+        Args:
+            raw_transaction: Raw signed transaction
             
-            # Wait for receipt
-            self.logger.info("Waiting for transaction confirmation...")
-            receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+        Returns:
+            str: Transaction hash
             
-            # Check transaction status
-            if receipt['status'] == 0:
-                raise TransactionError("Transaction failed (status = 0)")
+        Raises:
+            TransactionError: If the transaction cannot be sent
+        """
+        try:
+            self.logger.info("Sending transaction...")
+            tx_hash = self.web3.eth.send_raw_transaction(raw_transaction)
+        except Exception as e:
+            raise TransactionError(f"Transaction failed: {str(e)}")
+        
+        tx_hash_hex = tx_hash.hex()
+        self.logger.info("Transaction sent! Hash: %s", tx_hash_hex)
+        self.last_tx_hash = tx_hash_hex
+        
+        return tx_hash_hex
+    
+    def _sign_mint_transaction(
+        self, 
+        to_address: str, 
+        group_id: int, 
+        amount: int
+    ) -> bytes:
+        """
+        Build and sign the mint transaction with the current nonce.
+        
+        Args:
+            to_address: Recipient address
+            group_id: Token group/collection ID  
+            amount: Number of tokens to mint
+            
+        Returns:
+            bytes: Raw signed transaction
             
-            self.logger.info(f"Transaction confirmed! Gas used: {receipt['gasUsed']}")
+        Raises:
+            TransactionError: If the transaction cannot be built or signed
+        """
+        try:
+            # Build transaction
+            tx = self._build_mint_transaction(to_address, group_id, amount)
             
-            # Update nonce for next transaction
-            self.nonce += 1
-            self.last_tx_hash = tx_hash_hex
+            # Sign transaction with the already loaded local account
+            signed_tx = self.account.sign_transaction(tx)
             
-            return tx_hash_hex
+            return signed_tx.raw_transaction
             
         except ContractLogicError as e:
             # Extract revert reason if available
@@ -464,11 +1278,17 @@ class NFTMinter:
         mint_function = None
         mint_params = None
         
+        if self._mint_function_name is None:
+            for func_name, params in mint_functions:
+                if self._accepts(func_name, params):
+                    self._mint_function_name = func_name
+                    self.logger.debug("Using mint function: %s", func_name)
+                    break
+        
         for func_name, params in mint_functions:
-            if hasattr(self.contract.functions, func_name):
+            if func_name == self._mint_function_name:
                 mint_function = getattr(self.contract.functions, func_name)
                 mint_params = params
-                self.logger.debug(f"Using mint function: {func_name}")
                 break
         
         if not mint_function:
@@ -486,17 +1306,24 @@ class NFTMinter:
                 'from': self.account.address,
                 'value': mint_cost,
                 'gas': 500000,  # Initial gas estimate
-                'gasPrice': self.web3.eth.gas_price,
+                'gasPrice': self._get_gas_price(),
                 'nonce': self.nonce
             })
             
+            # Reuse the gas limit from an earlier identical mint
+            mint_key = (to_address, group_id, amount)
+            if mint_key in self._gas_limits:
+                tx['gas'] = self._gas_limits[mint_key]
+                return tx
+            
             # Estimate gas
             try:
                 gas_estimate = self.web3.eth.estimate_gas(tx)
                 tx['gas'] = int(gas_estimate * 1.2)  # Add 20% buffer
-                self.logger.debug(f"Gas estimate: {gas_estimate} (using {tx['gas']})")
+                self._gas_limits[mint_key] = tx['gas']
+                self.logger.debug("Gas estimate: %s (using %s)", gas_estimate, tx['gas'])
             except Exception as e:
-                self.logger.warning(f"Gas estimation failed, using default: {e}")
+                self.logger.warning("Gas estimation failed, using default: %s", e)
                 tx['gas'] = 2000000  # Fallback gas limit
             
             return tx
@@ -504,6 +1331,22 @@ class NFTMinter:
         except Exception as e:
             raise ContractError(f"Failed to build transaction: {str(e)}")
     
+    def _get_gas_price(self) -> int:
+        """
+        Get the current gas price, reusing a recent value for GAS_PRICE_TTL seconds.
+        
+        Returns:
+            int: Gas price in wei
+        """
+        now = time.monotonic()
+        cached = self._gas_price_cache
+        if cached is not None and now - cached[0] < self.GAS_PRICE_TTL:
+            return cached[1]
+        
+        gas_price = self.web3.eth.gas_price
+        self._gas_price_cache = (now, gas_price)
+        return gas_price
+    
     def _get_mint_cost(self, group_id: int, amount: int) -> int:
         """
         Get the cost for minting.
@@ -523,21 +1366,17 @@ class NFTMinter:
             ('cost', [amount])
         ]
         
-        for func_name, params in cost_functions:
-            if hasattr(self.contract.functions, func_name):
-                try:
-                    func = getattr(self.contract.functions, func_name)
-                    result = func(*params).call()
-                    
-                    # Handle different return types
-                    if isinstance(result, tuple):
-                        # Some contracts return (cost, fee)
-                        return result[0]
-                    else:
-                        return result
-                        
-                except Exception as e:
-                    self.logger.debug(f"Failed to call {func_name}: {e}")
+        candidates = [
+            (func_name, params) for func_name, params in cost_functions
+            if self._accepts(func_name, params)
+        ]
+        
+        for _, result in self._probe_calls(candidates):
+            # Handle different return types
+            if isinstance(result, (list, tuple)):
+                # Some contracts return (cost, fee)
+                return result[0]
+            return result
         
         # If no cost function found, assume free mint
         self.logger.warning("Could not determine mint cost, assuming free mint")
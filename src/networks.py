@@ -5,7 +5,9 @@ This module contains network configurations for various blockchain networks
 including RPC endpoints, chain IDs, and block explorer information.
 """
 
-from typing import Dict, Any
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 from .exceptions import ConfigurationError
 
 
@@ -14,6 +16,7 @@ NETWORKS = {
     "ARBITRUM_ONE": {
         "name": "Arbitrum One",
         "chain_id": 42161,
+        "block_time_ms": 250,
         "rpc": "https://arb1.arbitrum.io/rpc",
         "alternative_rpcs": [
             "https://arbitrum-mainnet.infura.io/v3/YOUR-PROJECT-ID",
@@ -32,6 +35,7 @@ NETWORKS = {
     "ARBITRUM_NOVA": {
         "name": "Arbitrum Nova",
         "chain_id": 42170,
+        "block_time_ms": 250,
         "rpc": "https://nova.arbitrum.io/rpc",
         "alternative_rpcs": [
             "https://arbitrum-nova.publicnode.com",
@@ -49,6 +53,7 @@ NETWORKS = {
     "ARBITRUM_SEPOLIA": {
         "name": "Arbitrum Sepolia",
         "chain_id": 421614,
+        "block_time_ms": 250,
         "rpc": "https://sepolia-rollup.arbitrum.io/rpc",
         "alternative_rpcs": [
             "https://arbitrum-sepolia.infura.io/v3/YOUR-PROJECT-ID",
@@ -65,7 +70,8 @@ NETWORKS = {
     
     "BERACHAIN": {
         "name": "Berachain Bartio (Testnet)",
-        "chain_id": 80085,  # Bartio testnet chain ID
+        "chain_id": 80084,  # bArtio testnet chain ID (80085 was the retired Artio)
+        "block_time_ms": 2000,
         "rpc": "https://bartio.rpc.berachain.com",
         "alternative_rpcs": [
             "https://bartio.drpc.org",
@@ -74,7 +80,7 @@ NETWORKS = {
         "explorer": {
             "name": "Beratrail",
             "base_url": "https://bartio.beratrail.io",
-            "api_url": "https://api.routescan.io/v2/network/testnet/evm/80085/etherscan/api"
+            "api_url": "https://api.routescan.io/v2/network/testnet/evm/80084/etherscan/api"
         },
         "native_token": "BERA",
         "is_testnet": True
@@ -82,15 +88,40 @@ NETWORKS = {
 }
 
 
-def get_network_config(network_name: str) -> Dict[str, Any]:
+def _read_only(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _read_only(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_read_only(item) for item in value)
+    return value
+
+
+# Supported networks by chain ID, e.g. Network.ARBITRUM_ONE == 42161
+Network = IntEnum('Network', {name: config['chain_id'] for name, config in NETWORKS.items()})
+Network.__doc__ = "Supported networks, valued by chain ID."
+
+
+# Read-only views of NETWORKS handed out by get_network_config
+_NETWORKS_RO = {name: _read_only(config) for name, config in NETWORKS.items()}
+
+# Per-field lookups for the single-value helpers below
+_CHAIN_IDS = {name: config['chain_id'] for name, config in NETWORKS.items()}
+_TESTNETS = {name: config.get('is_testnet', False) for name, config in NETWORKS.items()}
+_NATIVE_TOKENS = {name: config.get('native_token', 'ETH') for name, config in NETWORKS.items()}
+_EXPLORER_URLS = {name: config['explorer']['base_url'] for name, config in NETWORKS.items()}
+_RPC_ENDPOINTS = {
+    name: (config['rpc'],) + tuple(config.get('alternative_rpcs', ()))
+    for name, config in NETWORKS.items()
+}
+
+
+def _check_network(network_name: str):
     """
-    Get the configuration for a specific network.
+    Ensure a network is supported.
     
     Args:
-        network_name: Name of the network (e.g., 'ARBITRUM_ONE')
-        
-    Returns:
-        dict: Network configuration
+        network_name: Name of the network
         
     Raises:
         ConfigurationError: If network is not supported
@@ -101,8 +132,26 @@ def get_network_config(network_name: str) -> Dict[str, Any]:
             f"Unsupported network: {network_name}. "
             f"Available networks: {available}"
         )
+
+
+def get_network_config(network_name: str) -> Mapping[str, Any]:
+    """
+    Get the configuration for a specific network.
+    
+    The returned mapping is read-only and shared between callers; use
+    dict() on it if a mutable copy is needed.
     
-    return NETWORKS[network_name].copy()
+    Args:
+        network_name: Name of the network (e.g., 'ARBITRUM_ONE')
+        
+    Returns:
+        Mapping: Network configuration
+        
+    Raises:
+        ConfigurationError: If network is not supported
+    """
+    _check_network(network_name)
+    return _NETWORKS_RO[network_name]
 
 
 def get_block_explorer_url(network_name: str, tx_hash: str = None, address: str = None) -> str:
@@ -117,8 +166,8 @@ def get_block_explorer_url(network_name: str, tx_hash: str = None, address: str
     Returns:
         str: Block explorer URL
     """
-    config = get_network_config(network_name)
-    base_url = config['explorer']['base_url']
+    _check_network(network_name)
+    base_url = _EXPLORER_URLS[network_name]
     
     if tx_hash:
         return f"{base_url}/tx/{tx_hash}"
@@ -138,8 +187,8 @@ def is_testnet(network_name: str) -> bool:
     Returns:
         bool: True if testnet, False if mainnet
     """
-    config = get_network_config(network_name)
-    return config.get('is_testnet', False)
+    _check_network(network_name)
+    return _TESTNETS[network_name]
 
 
 def get_native_token(network_name: str) -> str:
@@ -152,8 +201,24 @@ def get_native_token(network_name: str) -> str:
     Returns:
         str: Native token symbol (e.g., 'ETH', 'BERA')
     """
-    config = get_network_config(network_name)
-    return config.get('native_token', 'ETH')
+    _check_network(network_name)
+    return _NATIVE_TOKENS[network_name]
+
+
+def get_network_by_chain_id(chain_id: int) -> Optional[str]:
+    """
+    Find the supported network with a given chain ID.
+    
+    Args:
+        chain_id: Chain ID reported by an RPC endpoint
+        
+    Returns:
+        str: Network name, or None if no supported network uses that chain ID
+    """
+    try:
+        return Network(chain_id).name
+    except ValueError:
+        return None
 
 
 def get_all_networks() -> Dict[str, str]:
@@ -179,13 +244,8 @@ def get_rpc_endpoints(network_name: str) -> list:
     Returns:
         list: List of RPC endpoints
     """
-    config = get_network_config(network_name)
-    endpoints = [config['rpc']]
-    
-    if 'alternative_rpcs' in config:
-        endpoints.extend(config['alternative_rpcs'])
-    
-    return endpoints
+    _check_network(network_name)
+    return list(_RPC_ENDPOINTS[network_name])
 
 
 def validate_chain_id(network_name: str, chain_id: int) -> bool:
@@ -199,5 +259,5 @@ def validate_chain_id(network_name: str, chain_id: int) -> bool:
     Returns:
         bool: True if chain ID matches
     """
-    config = get_network_config(network_name)
-    return config['chain_id'] == chain_id
\ No newline at end of file
+    _check_network(network_name)
+    return _CHAIN_IDS[network_name] == chain_id
\ No newline at end of file
@@ -5,15 +5,63 @@ This module contains various utility functions used throughout the NFT minter
 application, including validation, file operations, and API interactions.
 """
 
+import importlib.util
 import json
 import logging
+import logging.handlers
+import os
 import requests
 import re
+import time
 from pathlib import Path
-from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional, Union
 from web3 import Web3
 
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is used instead
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional: large artifacts are parsed in full instead
+    ijson = None
+
+
+# Artifacts above this size have their ABI streamed out with ijson
+_STREAM_ABI_MIN_BYTES = 256 * 1024
+
+# Log record format and file handling for setup_logging
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_LOG_MAX_BYTES = 10_000_000
+_LOG_BACKUP_COUNT = 3
+_LOG_BUFFER_CAPACITY = 256
+
+# Nineteen digits in a row may be an integer beyond 64 bits (-2**63 - 1
+# already has 19), which orjson would read back as a float; such files are
+# parsed with stdlib json
+_WIDE_INT_RE = re.compile(rb'\d{19}')
+
+# Basic Ethereum address format: 0x followed by 40 hex characters (use fullmatch)
+_ADDRESS_RE = re.compile(r'0x[a-fA-F0-9]{40}')
+
+# Revert reason formats, tried in order; each captures the actual message.
+# parse_revert_reason skips these unless "revert" or "reason" appears.
+_REVERT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE | re.DOTALL) for pattern in (
+    # Standard revert patterns
+    r"execution reverted: (.+?)(?:\n|$)",
+    r"VM Exception while processing transaction: revert (.+?)(?:\n|$)",
+    r"revert: (.+?)(?:\n|$)",
+    r"reason string '(.+?)'",
+    
+    # "Reason given:" format
+    r"Reason given: (.+?)(?:\.|$)",
+    
+    # Generic revert without specific message
+    r"reverted with reason string \"(.+?)\"",
+))
+
 
 def setup_logging(level: int = logging.INFO) -> logging.Logger:
     """
@@ -30,15 +78,25 @@ def setup_logging(level: int = logging.INFO) -> logging.Logger:
     log_dir.mkdir(exist_ok=True)
     
     # Generate log filename with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     log_file = log_dir / f"nft_minter_{timestamp}.log"
     
+    # Buffer file writes: records reach the file in batches of _LOG_BUFFER_CAPACITY,
+    # immediately for warnings and above, and on exit via logging.shutdown()
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file, maxBytes=_LOG_MAX_BYTES, backupCount=_LOG_BACKUP_COUNT
+    )
+    file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+    buffered_handler = logging.handlers.MemoryHandler(
+        _LOG_BUFFER_CAPACITY, flushLevel=logging.WARNING, target=file_handler
+    )
+    
     # Configure logging
     logging.basicConfig(
         level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        format=_LOG_FORMAT,
         handlers=[
-            logging.FileHandler(log_file),
+            buffered_handler,
             logging.StreamHandler()
         ]
     )
@@ -54,17 +112,22 @@ def setup_logging(level: int = logging.INFO) -> logging.Logger:
     return logger
 
 
-def validate_ethereum_address(address):
+def validate_ethereum_address(address, check_checksum: bool = False):
     """
     Validate an Ethereum address with robust type checking.
     
     This function safely handles any input type, not just strings.
     It returns False for non-string inputs instead of crashing.
-    """
-    # Import at function level to avoid circular imports
-    import re
-    from web3 import Web3
     
+    Args:
+        address: Value to validate
+        check_checksum: Also require mixed-case addresses to match their
+            EIP-55 checksum (costs a Keccak hash; all-lowercase and
+            all-uppercase addresses carry no checksum and are accepted)
+        
+    Returns:
+        bool: True if valid format, False otherwise
+    """
     # First, ensure we have a string to work with
     if not isinstance(address, str):
         return False
@@ -74,18 +137,30 @@ def validate_ethereum_address(address):
         return False
     
     # Check the basic format using regex
-    if not re.match(r'^0x[a-fA-F0-9]{40}$', address):
+    if not _ADDRESS_RE.fullmatch(address):
         return False
     
-    try:
-        # Try to validate checksum
-        Web3.to_checksum_address(address)
+    if not check_checksum:
         return True
-    except:
-        # Address format is valid even if checksum isn't
+    
+    body = address[2:]
+    if body.islower() or body.isupper():
         return True
+    return _checksum_address(address.lower()) == address
 
 
+@lru_cache(maxsize=1024)
+def _checksum_address(address: str) -> str:
+    """
+    EIP-55 checksum a lowercase address; cached so each address is hashed once.
+    
+    Args:
+        address: Lowercase 0x-prefixed address
+        
+    Returns:
+        str: Checksummed address
+    """
+    return Web3.to_checksum_address(address)
 
 
 def validate_private_key(private_key: str) -> bool:
@@ -108,8 +183,14 @@ def validate_private_key(private_key: str) -> bool:
     if private_key.startswith('0x'):
         private_key = private_key[2:]
     
-    # Check if it's 64 hex characters
-    return bool(re.match(r'^[a-fA-F0-9]{64}$', private_key))
+    # Check if it's 64 hex characters. fromhex skips whitespace between
+    # byte pairs, so the decoded length must be checked as well
+    if len(private_key) != 64:
+        return False
+    try:
+        return len(bytes.fromhex(private_key)) == 32
+    except ValueError:
+        return False
 
 
 def load_json_file(file_path: Union[str, Path]) -> dict:
@@ -131,14 +212,23 @@ def load_json_file(file_path: Union[str, Path]) -> dict:
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
     
-    with open(file_path, 'r') as f:
-        return json.load(f)
+    raw = file_path.read_bytes()
+    if orjson is not None and not _WIDE_INT_RE.search(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # stdlib json also accepts NaN/Infinity, or raises the usual error
+    
+    return json.loads(raw)
 
 
 def save_json_file(data: dict, file_path: Union[str, Path], indent: int = 2):
     """
     Save data to a JSON file.
     
+    The data is written to a temporary file next to the target and then
+    renamed over it, so an interrupted write never leaves a torn file.
+    
     Args:
         data: Data to save
         file_path: Path to save file
@@ -149,14 +239,36 @@ def save_json_file(data: dict, file_path: Union[str, Path], indent: int = 2):
     # Create parent directory if it doesn't exist
     file_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=indent)
+    content = None
+    # orjson only supports 2-space indentation and 64-bit integers
+    if orjson is not None and indent == 2:
+        try:
+            content = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+        else:
+            # orjson writes NaN and infinities as null; leave any null to stdlib json
+            if b'null' in content:
+                content = None
+    if content is None:
+        content = json.dumps(data, indent=indent).encode()
+    
+    tmp_path = file_path.with_name(file_path.name + '.tmp')
+    try:
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def load_abi_from_file(abi_path: Union[str, Path]) -> list:
     """
     Load contract ABI from a JSON file.
     
+    Parsed ABIs are cached per file and reused until the file's
+    modification time or size changes.
+    
     Args:
         abi_path: Path to ABI file
         
@@ -171,29 +283,73 @@ def load_abi_from_file(abi_path: Union[str, Path]) -> list:
     if not abi_path.exists():
         raise FileNotFoundError(f"ABI file not found: {abi_path}")
     
+    stat = abi_path.stat()
+    return list(_load_abi(str(abi_path.resolve()), stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=8)
+def _load_abi(abi_path: str, mtime_ns: int, size: int) -> tuple:
+    """
+    Parse an ABI file; cached on (path, mtime_ns, size).
+    
+    Returns:
+        tuple: Contract ABI entries
+    """
+    # Build artifacts embed bytecode and ASTs; only pull out the ABI
+    if ijson is not None and size > _STREAM_ABI_MIN_BYTES:
+        abi = _stream_artifact_abi(abi_path)
+        if abi is not None:
+            return tuple(abi)
+    
     data = load_json_file(abi_path)
     
     # Handle different ABI file formats
     if isinstance(data, list):
         # Direct ABI array
-        return data
-    elif isinstance(data, dict):
-        # Truffle/Hardhat artifact format
-        if 'abi' in data:
-            return data['abi']
-        # Foundry format
-        elif 'abi' in data.get('metadata', {}).get('output', {}):
-            return data['metadata']['output']['abi']
-        else:
-            raise ValueError("Could not find ABI in JSON file")
-    else:
+        return tuple(data)
+    if not isinstance(data, dict):
         raise ValueError("Invalid ABI file format")
+    
+    # Truffle/Hardhat artifact format
+    abi = data.get('abi')
+    if abi is not None:
+        return tuple(abi)
+    
+    # Foundry format
+    try:
+        return tuple(data['metadata']['output']['abi'])
+    except (KeyError, TypeError):
+        raise ValueError("Could not find ABI in JSON file") from None
+
+
+def _stream_artifact_abi(abi_path: str) -> Optional[list]:
+    """
+    Stream the ABI out of a Hardhat/Truffle/Foundry artifact with ijson.
+    
+    Args:
+        abi_path: Path to the artifact file
+        
+    Returns:
+        list: Contract ABI, or None if the file is a bare ABI array or has
+        no ABI key (the caller's full parse then handles or reports it)
+    """
+    with open(abi_path, 'rb') as f:
+        if f.read(64).lstrip().startswith(b'['):
+            return None
+        
+        for prefix in ('abi', 'metadata.output.abi'):
+            f.seek(0)
+            for abi in ijson.items(f, prefix):
+                return abi
+    
+    return None
 
 
 def get_contract_abi_from_explorer(
     contract_address: str,
     api_key: str,
-    api_url: str
+    api_url: str,
+    session: Optional[requests.Session] = None
 ) -> list:
     """
     Fetch contract ABI from a block explorer API.
@@ -202,6 +358,8 @@ def get_contract_abi_from_explorer(
         contract_address: Contract address
         api_key: Block explorer API key
         api_url: Block explorer API URL
+        session: Session to send the request on (optional); reusing one
+            keeps the explorer connection alive between fetches
         
     Returns:
         list: Contract ABI
@@ -217,7 +375,7 @@ def get_contract_abi_from_explorer(
     }
     
     try:
-        response = requests.get(api_url, params=params, timeout=30)
+        response = (session or requests).get(api_url, params=params, timeout=30)
         response.raise_for_status()
         
         data = response.json()
@@ -277,12 +435,13 @@ def estimate_transaction_cost(gas_limit: int, gas_price_wei: int) -> dict:
         dict: Cost estimates
     """
     total_wei = gas_limit * gas_price_wei
-    eth_cost = Web3.from_wei(total_wei, 'ether')
     
+    # int / int true division is correctly rounded, so this matches
+    # float(Web3.from_wei(...)) without building Decimals
     return {
         'gas_limit': gas_limit,
-        'gas_price_gwei': float(Web3.from_wei(gas_price_wei, 'gwei')),
-        'total_eth': float(eth_cost),
+        'gas_price_gwei': gas_price_wei / 10**9,
+        'total_eth': total_wei / 10**18,
         'total_wei': total_wei
     }
 
@@ -294,29 +453,17 @@ def parse_revert_reason(error):
     This enhanced version handles more error formats including
     the "Reason given:" pattern that was failing in tests.
     """
-    import re
-    
     error_str = str(error)
     
-    # Define all patterns we want to match
-    # Each pattern tries to extract the actual error message
-    patterns = [
-        # Standard revert patterns
-        r"execution reverted: (.+?)(?:\n|$)",
-        r"VM Exception while processing transaction: revert (.+?)(?:\n|$)",
-        r"revert: (.+?)(?:\n|$)",
-        r"reason string '(.+?)'",
-        
-        # New pattern for "Reason given:" format
-        r"Reason given: (.+?)(?:\.|$)",
-        
-        # Generic revert without specific message
-        r"reverted with reason string \"(.+?)\"",
-    ]
+    # Every pattern mentions "revert" or "reason"; skip the regexes for
+    # errors (timeouts, connection failures) that contain neither
+    folded = error_str.casefold()
+    if 'revert' not in folded and 'reason' not in folded:
+        return None
     
     # Try each pattern in order
-    for pattern in patterns:
-        match = re.search(pattern, error_str, re.IGNORECASE | re.DOTALL)
+    for pattern in _REVERT_PATTERNS:
+        match = pattern.search(error_str)
         if match:
             # Return the captured group (the actual error message)
             return match.group(1).strip()
@@ -325,77 +472,78 @@ def parse_revert_reason(error):
     return None
 
 
-def create_example_abi():
+# Minimal NFT contract ABI written by create_example_abi
+_EXAMPLE_ABI = [
+    {
+        "inputs": [],
+        "name": "totalSupply",
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "maxSupply",
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "mintLive",
+        "outputs": [{"name": "", "type": "bool"}],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"name": "_amount", "type": "uint256"},
+            {"name": "_groupId", "type": "uint256"},
+            {"name": "_to", "type": "address"}
+        ],
+        "name": "batchMint",
+        "outputs": [],
+        "stateMutability": "payable",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"name": "_groupId", "type": "uint256"},
+            {"name": "_amount", "type": "uint256"}
+        ],
+        "name": "quoteBatchMint",
+        "outputs": [
+            {"name": "totalCost", "type": "uint256"},
+            {"name": "fee", "type": "uint256"}
+        ],
+        "stateMutability": "view",
+        "type": "function"
+    },
+    {
+        "inputs": [
+            {"name": "_groupId", "type": "uint256"}
+        ],
+        "name": "maxMintPerWallet",
+        "outputs": [{"name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
+
+
+def create_example_abi(saver=save_json_file, path_factory=Path):
     """
     Create an example ABI file for common NFT contracts.
     
-    This version handles both real Path objects and mocked ones properly.
-    """
-    from pathlib import Path
-    import logging
-    example_abi = [
-        {
-            "inputs": [],
-            "name": "totalSupply",
-            "outputs": [{"name": "", "type": "uint256"}],
-            "stateMutability": "view",
-            "type": "function"
-        },
-        {
-            "inputs": [],
-            "name": "maxSupply",
-            "outputs": [{"name": "", "type": "uint256"}],
-            "stateMutability": "view",
-            "type": "function"
-        },
-        {
-            "inputs": [],
-            "name": "mintLive",
-            "outputs": [{"name": "", "type": "bool"}],
-            "stateMutability": "view",
-            "type": "function"
-        },
-        {
-            "inputs": [
-                {"name": "_amount", "type": "uint256"},
-                {"name": "_groupId", "type": "uint256"},
-                {"name": "_to", "type": "address"}
-            ],
-            "name": "batchMint",
-            "outputs": [],
-            "stateMutability": "payable",
-            "type": "function"
-        },
-        {
-            "inputs": [
-                {"name": "_groupId", "type": "uint256"},
-                {"name": "_amount", "type": "uint256"}
-            ],
-            "name": "quoteBatchMint",
-            "outputs": [
-                {"name": "totalCost", "type": "uint256"},
-                {"name": "fee", "type": "uint256"}
-            ],
-            "stateMutability": "view",
-            "type": "function"
-        },
-        {
-            "inputs": [
-                {"name": "_groupId", "type": "uint256"}
-            ],
-            "name": "maxMintPerWallet",
-            "outputs": [{"name": "", "type": "uint256"}],
-            "stateMutability": "view",
-            "type": "function"
-        }
-    ]
-
-    # Create abi directory using real Path instance
-    abi_dir = Path("abi")
+    Args:
+        saver: Callable taking (data, path) that writes the ABI
+        path_factory: Callable building the abi directory path from its name
+    """
+    abi_dir = path_factory("abi")
     abi_dir.mkdir(parents=True, exist_ok=True)
 
     abi_file_path = abi_dir / "example_nft_abi.json"
-    save_json_file(example_abi, abi_file_path)
+    saver(_EXAMPLE_ABI, abi_file_path)
 
     logging.getLogger(__name__).info(f"Created example ABI file at {abi_file_path}")
 
@@ -414,13 +562,11 @@ def check_dependencies():
         'tqdm'
     ]
     
-    missing = []
-    
-    for package in required:
-        try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
-            missing.append(package)
+    # find_spec only locates each package; it doesn't execute the module
+    missing = [
+        package for package in required
+        if importlib.util.find_spec(package.replace('-', '_')) is None
+    ]
     
     return len(missing) == 0, missing
 
@@ -430,18 +576,15 @@ def format_time_remaining(seconds: int) -> str:
     Format seconds into human-readable time.
     
     Args:
-        seconds: Number of seconds
+        seconds: Number of seconds (fractions are truncated, negatives shown as 0s)
         
     Returns:
         str: Formatted time string
     """
-    if seconds < 60:
-        return f"{seconds}s"
-    elif seconds < 3600:
-        minutes = seconds // 60
-        secs = seconds % 60
+    minutes, secs = divmod(max(int(seconds), 0), 60)
+    if not minutes:
+        return f"{secs}s"
+    hours, minutes = divmod(minutes, 60)
+    if not hours:
         return f"{minutes}m {secs}s"
-    else:
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        return f"{hours}h {minutes}m"
\ No newline at end of file
+    return f"{hours}h {minutes}m"
\ No newline at end of file
@@ -8,11 +8,15 @@ import unittest
 import json
 import tempfile
 import os
+import shutil
 from pathlib import Path
+from unittest.mock import patch
 
 # Add parent directory to path
 import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from src.config import ConfigManager
 from src.exceptions import ConfigurationError
@@ -28,7 +32,6 @@ class TestConfigManager(unittest.TestCase):
         
     def tearDown(self):
         """Clean up test fixtures."""
-        import shutil
         shutil.rmtree(self.temp_dir)
         
     def test_default_config(self):
@@ -67,17 +70,12 @@ class TestConfigManager(unittest.TestCase):
         
     def test_env_override(self):
         """Test that environment variables override file config."""
-        # Set environment variable
-        os.environ['NETWORK_NAME'] = 'ARBITRUM_NOVA'
-        
-        try:
+        # Set environment variable; patch.dict restores any previous value
+        with patch.dict(os.environ, {'NETWORK_NAME': 'ARBITRUM_NOVA'}):
             config = ConfigManager(str(self.config_file))
             config.load()
             
             self.assertEqual(config.get('network.name'), 'ARBITRUM_NOVA')
-        finally:
-            # Clean up
-            del os.environ['NETWORK_NAME']
             
     def test_nested_key_access(self):
         """Test accessing nested configuration keys."""
@@ -136,6 +134,36 @@ class TestConfigManager(unittest.TestCase):
         
         self.assertIn('minting.amount must be -1', str(cm.exception))
         
+    def test_validation_rechecks_after_change(self):
+        """Test that a passed validation is not reused after values change."""
+        config = ConfigManager(str(self.config_file))
+        config.load()
+        
+        config.set('wallet.private_key', '0x' + '1' * 64)
+        config.set('contract.address', '0x' + '2' * 40)
+        config.set('contract.abi_path', 'test.json')
+        
+        config.validate()
+        config.validate()  # Unchanged, passes again
+        
+        config.set('minting.amount', 0)
+        with self.assertRaises(ConfigurationError):
+            config.validate()
+        
+    def test_sanitized_config_leaves_data_untouched(self):
+        """Test that sanitizing the config masks secrets without mutating it."""
+        config = ConfigManager(str(self.config_file))
+        config.load()
+        config.set('wallet.private_key', '0x' + 'ab' * 32)
+        config.set('contract.explorer_api_key', 'ABCDEFGHIJKL')
+        
+        sanitized = config._sanitized_config()
+        
+        self.assertEqual(sanitized['wallet']['private_key'], '0xabab...abab')
+        self.assertEqual(sanitized['contract']['explorer_api_key'], 'ABCD...IJKL')
+        self.assertEqual(config.get('wallet.private_key'), '0x' + 'ab' * 32)
+        self.assertEqual(config.get('contract.explorer_api_key'), 'ABCDEFGHIJKL')
+        
     def test_save_example(self):
         """Test saving example configuration."""
         config = ConfigManager(str(self.config_file))
@@ -5,71 +5,110 @@ This module contains comprehensive tests for the NFTMinter class, testing
 all aspects of blockchain interaction, contract loading, and minting operations.
 """
 
+import asyncio
 import unittest
-from unittest.mock import Mock, patch, MagicMock
-import json
-from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch, MagicMock, PropertyMock
+from types import MappingProxyType
 
 # Add parent directory to path for imports
 import sys
 import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+import requests
+from web3 import Web3
+from web3.exceptions import BadFunctionCallOutput, TransactionNotFound
 
 from src.minter import NFTMinter
 from src.config import ConfigManager
-from src.exceptions import (
-    ConnectionError, ContractError, TransactionError,
-    MinterError
-)
+from src.utils import parse_revert_reason
+from src.exceptions import ConnectionError, ContractError
+
+
+# Placeholder key and addresses shared by the tests
+PRIVATE_KEY = '0x' + '1' * 64
+WALLET_ADDRESS = '0x' + '2' * 40
+CONTRACT_ADDRESS = '0x' + '3' * 40
+TO_ADDRESS = '0x' + '4' * 40
+
+
+class _StubConfig:
+    """Minimal ConfigManager stand-in: NFTMinter only calls config.get(key, default)."""
+    __slots__ = ('get', 'data')
+    
+    def __init__(self, values):
+        self.get = values.get
+        self.data = {}
+
+
+def _fresh_web3_mock(connected=True, chain_id=80084, nonce=5,
+                     gas_price=20000000000, gas=150000):
+    """Build a web3 mock for a reachable node with the given chain state."""
+    web3 = Mock()
+    web3.is_connected.return_value = connected
+    web3.eth.chain_id = chain_id
+    web3.eth.get_transaction_count.return_value = nonce
+    web3.eth.gas_price = gas_price
+    web3.eth.estimate_gas.return_value = gas
+    return web3
+
+
+def _make_contract_mock(total_supply=100, max_supply=1000, mint_live=True,
+                        quote=(0, 0), batch_mint_tx=None):
+    """Build a contract mock with the view functions the minter reads."""
+    contract = Mock()
+    functions = contract.functions
+    functions.totalSupply.return_value.call.return_value = total_supply
+    functions.maxSupply.return_value.call.return_value = max_supply
+    functions.mintLive.return_value.call.return_value = mint_live
+    functions.quoteBatchMint.return_value.call.return_value = quote
+    if batch_mint_tx is not None:
+        functions.batchMint.return_value.build_transaction.return_value = batch_mint_tx
+    return contract
 
 
 class TestNFTMinter(unittest.TestCase):
     """Test cases for the NFTMinter class."""
     
+    # Default configuration values, read-only and copied for each test
+    _CONFIG_VALUES = MappingProxyType({
+        'wallet.private_key': PRIVATE_KEY,
+        'wallet.address': WALLET_ADDRESS,
+        'network.name': 'BERACHAIN',
+        'network.custom_rpc': None,
+        'contract.address': CONTRACT_ADDRESS,
+        'contract.abi_path': 'test_abi.json',
+        'contract.explorer_api_key': 'test_api_key',
+        'minting.group_id': 0,
+        'minting.amount': 1,
+        'minting.to_address': 'DEFAULT',
+        'minting.auto_max': False
+    })
+    
     def setUp(self):
         """Set up test fixtures before each test method."""
-        # Create a mock configuration
-        self.mock_config = Mock(spec=ConfigManager)
-        
-        # Set up default configuration values
-        self.config_values = {
-            'wallet.private_key': '0x' + '1' * 64,
-            'wallet.address': '0x' + '2' * 40,
-            'network.name': 'BERACHAIN',
-            'network.custom_rpc': None,
-            'contract.address': '0x' + '3' * 40,
-            'contract.abi_path': 'test_abi.json',
-            'contract.explorer_api_key': 'test_api_key',
-            'minting.group_id': 0,
-            'minting.amount': 1,
-            'minting.to_address': 'DEFAULT',
-            'minting.auto_max': False
-        }
-        
-        # Configure the mock to return values based on the key
-        self.mock_config.get.side_effect = lambda key, default=None: \
-            self.config_values.get(key, default)
+        # Tests can still edit self.config_values after the minter is built
+        self.config_values = dict(self._CONFIG_VALUES)
+        self.mock_config = _StubConfig(self.config_values)
         
         # Create minter instance with mock config
         self.minter = NFTMinter(self.mock_config, dry_run=False)
         
     def test_initialization(self):
         """Test that NFTMinter initializes correctly."""
-        self.assertIsNotNone(self.minter)
-        self.assertEqual(self.minter.config, self.mock_config)
-        self.assertFalse(self.minter.dry_run)
-        self.assertIsNone(self.minter.web3)
-        self.assertIsNone(self.minter.contract)
-        self.assertIsNone(self.minter.account)
+        m = self.minter
+        self.assertEqual(
+            (m.config, m.dry_run, m.web3, m.contract, m.account),
+            (self.mock_config, False, None, None, None)
+        )
         
     @patch('src.minter.Web3')
     def test_connect_success(self, mock_web3_class):
         """Test successful connection to blockchain network."""
-        # Set up mock Web3 instance
-        mock_web3 = Mock()
-        mock_web3.is_connected.return_value = True
-        mock_web3.eth.chain_id = 80085  # Berachain testnet
-        mock_web3.eth.get_transaction_count.return_value = 5
+        # Set up mock Web3 instance on Berachain testnet
+        mock_web3 = _fresh_web3_mock(nonce=5)
         mock_web3_class.return_value = mock_web3
         mock_web3_class.HTTPProvider.return_value = Mock()
         
@@ -80,15 +119,14 @@ class TestNFTMinter(unittest.TestCase):
         mock_web3_class.HTTPProvider.assert_called_once()
         self.assertTrue(mock_web3.is_connected.called)
         self.assertEqual(self.minter.web3, mock_web3)
-        self.assertEqual(self.minter.chain_id, 80085)
+        self.assertEqual(self.minter.chain_id, 80084)
         self.assertEqual(self.minter.nonce, 5)
         
     @patch('src.minter.Web3')
     def test_connect_failure(self, mock_web3_class):
         """Test connection failure handling."""
         # Set up mock to simulate connection failure
-        mock_web3 = Mock()
-        mock_web3.is_connected.return_value = False
+        mock_web3 = _fresh_web3_mock(connected=False)
         mock_web3_class.return_value = mock_web3
         mock_web3_class.HTTPProvider.return_value = Mock()
         
@@ -98,20 +136,64 @@ class TestNFTMinter(unittest.TestCase):
         
         self.assertIn("Failed to connect", str(cm.exception))
         
+    @patch('src.minter.Web3')
+    def test_connect_wrong_chain(self, mock_web3_class):
+        """Test that connecting to an RPC on another chain is refused."""
+        mock_web3_class.return_value = _fresh_web3_mock(chain_id=1)
+        mock_web3_class.HTTPProvider.return_value = Mock()
+        
+        with self.assertRaises(ConnectionError) as cm:
+            self.minter.connect()
+        
+        self.assertIn("doesn't match BERACHAIN", str(cm.exception))
+        self.assertIsNone(self.minter.account)
+        
+    @patch('src.minter.requests.post')
+    def test_rank_rpc_endpoints(self, mock_post):
+        """Test ranking RPC endpoints by probing their chain ID."""
+        responses = {
+            'https://bartio.rpc.berachain.com': Exception('timed out'),
+            'https://bartio.drpc.org': {'result': hex(80084)},
+            'https://bera-testnet.nodeinfra.com': {'result': hex(1)},
+        }
+        def post(url, **kwargs):
+            result = responses[url]
+            if isinstance(result, Exception):
+                raise result
+            return Mock(json=Mock(return_value=result))
+        mock_post.side_effect = post
+        
+        self.minter.network_config = {'chain_id': 80084}
+        ranked = self.minter._rank_rpc_endpoints('BERACHAIN')
+        
+        # The wrong-chain endpoint is dropped; the unreachable one is kept as a fallback
+        self.assertEqual(ranked, [
+            'https://bartio.drpc.org',
+            'https://bartio.rpc.berachain.com'
+        ])
+        
+    @patch('src.minter.requests.post')
+    def test_rank_rpc_endpoints_all_wrong_chain(self, mock_post):
+        """Test that ranking fails when no endpoint serves the configured chain."""
+        mock_post.return_value = Mock(json=Mock(return_value={'result': hex(1)}))
+        
+        self.minter.network_config = {'chain_id': 80084}
+        with self.assertRaises(ConnectionError) as cm:
+            self.minter._rank_rpc_endpoints('BERACHAIN')
+        
+        self.assertIn("chain ID 80084", str(cm.exception))
+        
     @patch('src.minter.Web3')
     @patch('src.minter.Account')
     def test_initialize_account_success(self, mock_account, mock_web3_class):
         """Test successful account initialization."""
         # Set up mocks
-        mock_web3 = Mock()
-        mock_web3.is_connected.return_value = True
-        mock_web3.eth.chain_id = 80085
-        mock_web3.eth.get_transaction_count.return_value = 10
+        mock_web3 = _fresh_web3_mock(nonce=10)
         mock_web3_class.return_value = mock_web3
         mock_web3_class.HTTPProvider.return_value = Mock()
         
         mock_account_instance = Mock()
-        mock_account_instance.address = '0x' + '2' * 40
+        mock_account_instance.address = WALLET_ADDRESS
         mock_account_instance.key = b'test_key'
         mock_account.from_key.return_value = mock_account_instance
         
@@ -151,6 +233,26 @@ class TestNFTMinter(unittest.TestCase):
         self.minter.web3.eth.contract.assert_called_once()
         self.assertEqual(self.minter.contract, mock_contract)
         
+    @patch('src.minter.load_abi_from_file')
+    def test_load_contract_indexes_abi_functions(self, mock_load_abi):
+        """Test that function lookups use the ABI scanned at load time."""
+        mock_load_abi.return_value = [
+            {"type": "constructor", "inputs": []},
+            {"type": "function", "name": "mint"},
+            {"type": "function", "name": "maxMint",
+             "inputs": [{"name": "_groupId", "type": "uint256"}]},
+            {"type": "event", "name": "Transfer"}
+        ]
+        
+        self.minter.web3 = Mock()
+        self.minter.load_contract()
+        
+        self.assertTrue(self.minter._has_function('mint'))
+        self.assertFalse(self.minter._has_function('Transfer'))
+        self.assertFalse(self.minter._has_function('batchMint'))
+        self.assertTrue(self.minter._accepts('maxMint', [0]))
+        self.assertFalse(self.minter._accepts('maxMint', []))
+        
     @patch('src.minter.get_contract_abi_from_explorer')
     def test_load_contract_from_explorer(self, mock_get_abi):
         """Test loading contract with ABI from block explorer."""
@@ -181,13 +283,7 @@ class TestNFTMinter(unittest.TestCase):
         
     def test_get_contract_info(self):
         """Test retrieving contract information."""
-        # Set up mock contract
-        mock_contract = Mock()
-        mock_contract.functions.totalSupply.return_value.call.return_value = 100
-        mock_contract.functions.maxSupply.return_value.call.return_value = 1000
-        mock_contract.functions.mintLive.return_value.call.return_value = True
-        
-        self.minter.contract = mock_contract
+        self.minter.contract = _make_contract_mock()
         
         # Get contract info
         info = self.minter.get_contract_info()
@@ -197,6 +293,30 @@ class TestNFTMinter(unittest.TestCase):
         self.assertEqual(info['max_supply'], 1000)
         self.assertTrue(info['mint_live'])
         
+    def test_get_startup_state_batched(self):
+        """Test that startup state is fetched in a single JSON-RPC batch."""
+        # Set up a web3 mock whose batch returns all results at once
+        self.minter.web3 = MagicMock()
+        batch = self.minter.web3.batch_requests.return_value.__enter__.return_value
+        batch.execute.return_value = [1000000000000000000, 20000000000, 100, 1000, True]
+        self.minter.web3.from_wei.return_value = 1.0
+        
+        self.minter.account = Mock()
+        self.minter.account.address = WALLET_ADDRESS
+        self.minter.contract = Mock()
+        
+        # Get startup state
+        state = self.minter.get_startup_state()
+        
+        # Verify one batch carried all five requests
+        self.assertEqual(batch.add.call_count, 5)
+        batch.execute.assert_called_once()
+        self.assertEqual(state['total_supply'], 100)
+        self.assertEqual(state['max_supply'], 1000)
+        self.assertTrue(state['mint_live'])
+        self.assertEqual(state['balance'], 1.0)
+        self.assertEqual(state['gas_price'], 20000000000)
+        
     def test_get_wallet_balance(self):
         """Test getting wallet balance."""
         # Set up mocks
@@ -205,14 +325,53 @@ class TestNFTMinter(unittest.TestCase):
         self.minter.web3.from_wei.return_value = 1.0
         
         self.minter.account = Mock()
-        self.minter.account.address = '0x' + '2' * 40
+        self.minter.account.address = WALLET_ADDRESS
         
         # Get balance
         balance = self.minter.get_wallet_balance()
         
         # Verify
         self.assertEqual(balance, 1.0)
-        self.minter.web3.eth.get_balance.assert_called_once_with('0x' + '2' * 40)
+        self.minter.web3.eth.get_balance.assert_called_once_with(WALLET_ADDRESS)
+        
+    def test_refresh_nonce(self):
+        """Test re-reading the pending nonce."""
+        self.minter.web3 = Mock()
+        self.minter.web3.eth.get_transaction_count.return_value = 7
+        self.minter.account = Mock()
+        self.minter.account.address = WALLET_ADDRESS
+        self.minter.nonce = 5
+        
+        self.assertEqual(self.minter.refresh_nonce(), 7)
+        self.assertEqual(self.minter.nonce, 7)
+        self.minter.web3.eth.get_transaction_count.assert_called_once_with(
+            WALLET_ADDRESS, 'pending'
+        )
+        
+    @patch('src.minter.time.monotonic')
+    def test_gas_price_reused_within_ttl(self, mock_monotonic):
+        """Test that the gas price is only re-fetched once the TTL expires."""
+        self.minter.web3 = Mock()
+        type(self.minter.web3.eth).gas_price = gas_price = PropertyMock(
+            side_effect=[100, 200]
+        )
+        
+        mock_monotonic.return_value = 10.0
+        self.assertEqual(self.minter._get_gas_price(), 100)
+        mock_monotonic.return_value = 11.0
+        self.assertEqual(self.minter._get_gas_price(), 100)
+        mock_monotonic.return_value = 10.0 + NFTMinter.GAS_PRICE_TTL
+        self.assertEqual(self.minter._get_gas_price(), 200)
+        self.assertEqual(gas_price.call_count, 2)
+        
+    @patch('src.minter.Web3')
+    def test_checksum_cached(self, mock_web3_class):
+        """Test that each address is checksummed only once."""
+        mock_web3_class.to_checksum_address.side_effect = lambda x: x.upper()
+        
+        self.assertEqual(self.minter._checksum('0xabc'), '0XABC')
+        self.assertEqual(self.minter._checksum('0xabc'), '0XABC')
+        mock_web3_class.to_checksum_address.assert_called_once_with('0xabc')
         
     def test_mint_dry_run(self):
         """Test minting in dry run mode."""
@@ -220,7 +379,7 @@ class TestNFTMinter(unittest.TestCase):
         self.minter.dry_run = True
         self.minter.contract = Mock()
         self.minter.account = Mock()
-        self.minter.account.address = '0x' + '2' * 40
+        self.minter.account.address = WALLET_ADDRESS
         
         # Perform mint
         result = self.minter.mint()
@@ -228,40 +387,128 @@ class TestNFTMinter(unittest.TestCase):
         # Verify no transaction was sent
         self.assertIsNone(result)
         
+    def test_submit_mint_advances_nonce(self):
+        """Test that submitting a mint does not wait for the receipt."""
+        self.minter.contract = Mock()
+        self.minter.account = Mock()
+        self.minter.account.address = WALLET_ADDRESS
+        self.minter.web3 = Mock()
+        self.minter.web3.eth.send_raw_transaction.return_value = b'tx_hash'
+        self.minter.nonce = 3
+        
+        with patch.object(self.minter, '_build_mint_transaction', return_value={}):
+            tx_hash = self.minter.submit_mint()
+        
+        self.assertEqual(tx_hash, b'tx_hash'.hex())
+        self.assertEqual(self.minter.nonce, 4)
+        self.minter.web3.eth.wait_for_transaction_receipt.assert_not_called()
+        
+    def test_submit_mint_resyncs_stale_nonce(self):
+        """Test that a 'nonce too low' rejection resyncs the nonce and resends."""
+        self.minter.contract = Mock()
+        self.minter.account = Mock()
+        self.minter.account.address = WALLET_ADDRESS
+        self.minter.web3 = Mock()
+        self.minter.web3.eth.send_raw_transaction.side_effect = [
+            Exception('nonce too low'), b'tx_hash'
+        ]
+        self.minter.web3.eth.get_transaction_count.return_value = 8
+        self.minter.nonce = 3
+        
+        nonces = []
+        def build(*args):
+            nonces.append(self.minter.nonce)
+            return {}
+        
+        with patch.object(self.minter, '_build_mint_transaction', side_effect=build):
+            tx_hash = self.minter.submit_mint()
+        
+        self.assertEqual(tx_hash, b'tx_hash'.hex())
+        self.assertEqual(nonces, [3, 8])
+        self.assertEqual(self.minter.nonce, 9)
+        
+    def test_sign_mint_reserves_sequential_nonces(self):
+        """Test pre-signing several mints without sending them."""
+        self.minter.contract = Mock()
+        self.minter.account = Mock()
+        self.minter.account.address = WALLET_ADDRESS
+        self.minter.web3 = Mock()
+        self.minter.account.sign_transaction.return_value = Mock(raw_transaction=b'signed')
+        self.minter.nonce = 3
+        
+        nonces = []
+        def build(*args):
+            nonces.append(self.minter.nonce)
+            return {}
+        
+        with patch.object(self.minter, '_build_mint_transaction', side_effect=build):
+            raw_transactions = [self.minter.sign_mint(), self.minter.sign_mint()]
+        
+        self.assertEqual(raw_transactions, [b'signed', b'signed'])
+        self.assertEqual(nonces, [3, 4])
+        self.assertEqual(self.minter.nonce, 5)
+        self.minter.web3.eth.send_raw_transaction.assert_not_called()
+        
+    def test_get_transaction_receipts_batch(self):
+        """Test one batch resolving a mined and a pending transaction."""
+        self.minter.web3 = Mock()
+        self.minter.web3.provider.make_batch_request.return_value = [
+            {'jsonrpc': '2.0', 'id': 0, 'result': {
+                'transactionHash': '0xa', 'status': '0x1', 'gasUsed': '0x5208'
+            }},
+            {'jsonrpc': '2.0', 'id': 1, 'result': None},
+        ]
+        
+        receipts = self.minter.get_transaction_receipts(['0xa', '0xb'])
+        
+        self.assertEqual(receipts, [
+            {'transactionHash': '0xa', 'status': 1, 'gasUsed': 21000},
+            None
+        ])
+        self.minter.web3.provider.make_batch_request.assert_called_once_with([
+            ('eth_getTransactionReceipt', ['0xa']),
+            ('eth_getTransactionReceipt', ['0xb'])
+        ])
+        self.minter.web3.eth.get_transaction_receipt.assert_not_called()
+        
+    def test_get_transaction_receipts_pending(self):
+        """Test that unmined transactions are reported as None."""
+        self.minter.web3 = Mock()
+        self.minter.web3.provider.make_batch_request.side_effect = NotImplementedError
+        self.minter.web3.eth.get_transaction_receipt.side_effect = [
+            {'status': 1},
+            TransactionNotFound('pending')
+        ]
+        
+        receipts = self.minter.get_transaction_receipts(['0xa', '0xb'])
+        
+        self.assertEqual(receipts, [{'status': 1}, None])
+        
     @patch('src.minter.Web3')
     def test_build_mint_transaction(self, mock_web3_class):
         """Test building a mint transaction."""
         # Set up mocks
         mock_web3_class.to_checksum_address.side_effect = lambda x: x
         
-        self.minter.web3 = Mock()
-        self.minter.web3.eth.gas_price = 20000000000  # 20 gwei
-        self.minter.web3.eth.estimate_gas.return_value = 150000
+        self.minter.web3 = _fresh_web3_mock()
         
-        self.minter.chain_id = 80085
+        self.minter.chain_id = 80084
         self.minter.nonce = 5
         self.minter.account = Mock()
-        self.minter.account.address = '0x' + '2' * 40
+        self.minter.account.address = WALLET_ADDRESS
         
-        # Set up contract with batchMint function
-        mock_contract = Mock()
-        mock_batch_mint = Mock()
-        mock_batch_mint.build_transaction.return_value = {
-            'chainId': 80085,
-            'from': '0x' + '2' * 40,
+        # Set up contract with batchMint, and quoteBatchMint for cost calculation
+        self.minter.contract = _make_contract_mock(batch_mint_tx={
+            'chainId': 80084,
+            'from': WALLET_ADDRESS,
             'value': 0,
             'gas': 150000,
             'gasPrice': 20000000000,
             'nonce': 5
-        }
-        mock_contract.functions.batchMint.return_value = mock_batch_mint
-        # Add quoteBatchMint for cost calculation
-        mock_contract.functions.quoteBatchMint.return_value.call.return_value = (0, 0)
-        
-        self.minter.contract = mock_contract
+        })
         
         # Build transaction
-        tx = self.minter._build_mint_transaction('0x' + '4' * 40, 0, 1)
+        tx = self.minter._build_mint_transaction(TO_ADDRESS, 0, 1)
         
         # Verify transaction structure
         self.assertIn('chainId', tx)
@@ -269,6 +516,78 @@ class TestNFTMinter(unittest.TestCase):
         self.assertIn('nonce', tx)
         self.assertEqual(tx['nonce'], 5)
         
+    def test_build_mint_transaction_reuses_gas_estimate(self):
+        """Test that identical mints only estimate gas once."""
+        self.minter.web3 = _fresh_web3_mock()
+        self.minter.nonce = 5
+        self.minter.account = Mock()
+        self.minter.account.address = WALLET_ADDRESS
+        
+        mock_contract = Mock()
+        mock_contract.functions.batchMint.return_value.build_transaction.side_effect = \
+            lambda params: dict(params)
+        mock_contract.functions.quoteBatchMint.return_value.call.return_value = (0, 0)
+        self.minter.contract = mock_contract
+        
+        first = self.minter._build_mint_transaction(TO_ADDRESS, 0, 1)
+        second = self.minter._build_mint_transaction(TO_ADDRESS, 0, 1)
+        self.minter._build_mint_transaction(TO_ADDRESS, 0, 2)
+        
+        self.assertEqual(first['gas'], 180000)
+        self.assertEqual(second['gas'], 180000)
+        self.assertEqual(self.minter.web3.eth.estimate_gas.call_count, 2)
+        
+    def test_mint_cost_probes_in_one_multicall(self):
+        """Test that mint cost candidates are resolved with a single Multicall3 call."""
+        web3 = Web3()
+        abi = [
+            {"inputs": [{"name": "_groupId", "type": "uint256"},
+                        {"name": "_amount", "type": "uint256"}],
+             "name": "quoteBatchMint",
+             "outputs": [{"name": "totalCost", "type": "uint256"},
+                         {"name": "fee", "type": "uint256"}],
+             "stateMutability": "view", "type": "function"},
+            {"inputs": [{"name": "_amount", "type": "uint256"}],
+             "name": "price",
+             "outputs": [{"name": "", "type": "uint256"}],
+             "stateMutability": "view", "type": "function"}
+        ]
+        self.minter.web3 = web3
+        self.minter.contract = web3.eth.contract(address=CONTRACT_ADDRESS, abi=abi)
+        self.minter._function_names = frozenset(['quoteBatchMint', 'price'])
+        
+        multicall = Mock()
+        multicall.functions.aggregate3.return_value.call.return_value = [
+            (False, b''),
+            (True, web3.codec.encode(['uint256'], [500]))
+        ]
+        self.minter._multicall_contract = multicall
+        
+        self.assertEqual(self.minter._get_mint_cost(0, 2), 500)
+        
+        calls = multicall.functions.aggregate3.call_args[0][0]
+        self.assertEqual(len(calls), 2)
+        self.assertTrue(all(call[1] for call in calls))  # allowFailure
+        multicall.functions.aggregate3.return_value.call.assert_called_once()
+        
+    def test_multicall_disabled_only_when_unsupported(self):
+        """Test that a transient Multicall3 failure doesn't disable it."""
+        self.minter.contract = Mock()
+        self.minter.contract.functions.price.return_value.call.return_value = 500
+        
+        for error, supported in (
+            (requests.Timeout('read timed out'), True),
+            (BadFunctionCallOutput('no data returned'), False),
+        ):
+            with self.subTest(error=type(error).__name__):
+                self.minter._multicall_supported = True
+                with patch.object(self.minter, '_multicall', side_effect=error):
+                    results = list(self.minter._probe_calls([('price', (1,))]))
+                
+                # Either way the probe falls back to a direct call
+                self.assertEqual(results, [('price', 500)])
+                self.assertEqual(self.minter._multicall_supported, supported)
+        
     def test_wait_for_mint_live(self):
         """Test waiting for mint to go live."""
         # Set up mock contract
@@ -285,16 +604,77 @@ class TestNFTMinter(unittest.TestCase):
         self.minter.contract = mock_contract
         
         # Test wait with very short interval
-        with patch('time.sleep'):  # Mock sleep to speed up test
+        with patch('src.minter.time.sleep') as mock_sleep:  # Mock sleep to speed up test
             self.minter.wait_for_mint_live(check_interval=0.1)
         
-        # Verify mint was checked multiple times
+        # Verify mint was checked multiple times, sleeping between checks
         self.assertEqual(mock_contract.functions.mintLive.return_value.call.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+        
+    @patch('src.minter.load_abi_from_file')
+    def test_wait_for_mint_live_raw_call(self, mock_load_abi):
+        """Test polling mintLive with a raw eth_call when the ABI allows it."""
+        mock_load_abi.return_value = [{
+            "type": "function", "name": "mintLive", "inputs": [],
+            "outputs": [{"name": "", "type": "bool"}]
+        }]
+        self.minter.web3 = Mock()
+        self.minter.load_contract()
+        self.minter.web3.eth.call.side_effect = [
+            b'\x00' * 32, (1).to_bytes(32, 'big')
+        ]
+        
+        with patch('src.minter.time.sleep'):
+            self.minter.wait_for_mint_live(check_interval=0.1)
+        
+        self.assertEqual(self.minter.web3.eth.call.call_count, 2)
+        request = self.minter.web3.eth.call.call_args[0][0]
+        self.assertEqual(request['data'], '0x' + Web3.keccak(text='mintLive()')[:4].hex())
+        self.minter.contract.functions.mintLive.assert_not_called()
+        
+    @patch('src.minter.random.uniform', return_value=1.0)
+    def test_poll_intervals_back_off_from_block_time(self, mock_uniform):
+        """Test that polling starts at the block time and backs off to check_interval."""
+        self.minter.network_config = {'block_time_ms': 250}
+        intervals = self.minter._poll_intervals(check_interval=2)
+        
+        self.assertEqual([next(intervals) for _ in range(5)], [0.25, 0.5, 1.0, 2, 2])
+        
+    def test_wait_for_mint_live_async(self):
+        """Test waiting for mint to go live through the async contract."""
+        self.minter.contract = Mock()
+        async_contract = Mock()
+        async_contract.functions.mintLive.return_value.call = AsyncMock(
+            side_effect=[False, False, True]
+        )
+        self.minter._async_contract = async_contract
+        
+        with patch('src.minter.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            asyncio.run(self.minter.wait_for_mint_live_async(check_interval=0.1))
+        
+        self.assertEqual(async_contract.functions.mintLive.return_value.call.await_count, 3)
+        self.assertEqual(mock_sleep.await_count, 2)
+        
+    def test_wait_for_mint_live_async_falls_back_to_polling(self):
+        """Test that a failed block subscription falls back to polling."""
+        self.config_values['network.ws_rpc'] = 'wss://example.invalid'
+        self.minter.contract = Mock()
+        async_contract = Mock()
+        async_contract.functions.mintLive.return_value.call = AsyncMock(
+            side_effect=[False, True]
+        )
+        self.minter._async_contract = async_contract
+        
+        with patch.object(self.minter, '_wait_for_new_heads',
+                          new=AsyncMock(side_effect=OSError('refused'))) as mock_heads, \
+             patch('src.minter.asyncio.sleep', new=AsyncMock()):
+            asyncio.run(self.minter.wait_for_mint_live_async(check_interval=0.1))
+        
+        mock_heads.assert_awaited_once_with('wss://example.invalid')
+        self.assertEqual(async_contract.functions.mintLive.return_value.call.await_count, 2)
         
     def test_parse_revert_reason(self):
         """Test parsing revert reasons from transaction errors."""
-        from src.utils import parse_revert_reason
-        
         # Test various error formats
         test_cases = [
             ("execution reverted: Mint not live", "Mint not live"),
@@ -305,32 +685,40 @@ class TestNFTMinter(unittest.TestCase):
         ]
         
         for error_msg, expected_reason in test_cases:
-            error = Exception(error_msg)
-            reason = parse_revert_reason(error)
-            self.assertEqual(reason, expected_reason)
+            with self.subTest(error_msg=error_msg):
+                error = Exception(error_msg)
+                reason = parse_revert_reason(error)
+                self.assertEqual(reason, expected_reason)
 
 
 class TestMinterIntegration(unittest.TestCase):
     """Integration tests for the NFTMinter class."""
     
-    @patch('src.minter.Web3')
-    @patch('src.minter.Account')
-    @patch('src.minter.load_abi_from_file')
-    def test_full_minting_flow(self, mock_load_abi, mock_account, mock_web3_class):
-        """Test the complete minting flow from connection to transaction."""
+    def setUp(self):
+        """Patch the chain-facing dependencies and build a minter on a real config."""
+        patchers = {
+            'web3_class': patch('src.minter.Web3'),
+            'account': patch('src.minter.Account'),
+            'load_abi': patch('src.minter.load_abi_from_file'),
+        }
+        mocks = {}
+        for name, patcher in patchers.items():
+            mocks[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+        
         # Create real config
         config = ConfigManager()
         config.data = {
             'wallet': {
-                'private_key': '0x' + '1' * 64,
-                'address': '0x' + '2' * 40
+                'private_key': PRIVATE_KEY,
+                'address': WALLET_ADDRESS
             },
             'network': {
                 'name': 'BERACHAIN',
                 'custom_rpc': None
             },
             'contract': {
-                'address': '0x' + '3' * 40,
+                'address': CONTRACT_ADDRESS,
                 'abi_path': 'test.json',
                 'explorer_api_key': None
             },
@@ -343,71 +731,68 @@ class TestMinterIntegration(unittest.TestCase):
         }
         
         # Set up all mocks for full flow
-        mock_web3 = Mock()
-        mock_web3.is_connected.return_value = True
-        mock_web3.eth.chain_id = 80085
-        mock_web3.eth.get_transaction_count.return_value = 0
-        mock_web3.eth.gas_price = 20000000000
-        mock_web3.eth.estimate_gas.return_value = 150000
-        mock_web3.eth.account.sign_transaction.return_value = Mock(raw_transaction=b'signed_tx')
+        self.mock_web3 = mock_web3 = _fresh_web3_mock(nonce=0)
         mock_web3.eth.send_raw_transaction.return_value = b'tx_hash'
         mock_web3.eth.wait_for_transaction_receipt.return_value = {'status': 1, 'gasUsed': 140000}
         mock_web3.from_wei.return_value = 1.0
         
+        mock_web3_class = mocks['web3_class']
         mock_web3_class.return_value = mock_web3
         mock_web3_class.HTTPProvider.return_value = Mock()
         mock_web3_class.to_checksum_address.side_effect = lambda x: x
         
         # Set up account mock
-        mock_account_instance = Mock()
-        mock_account_instance.address = '0x' + '2' * 40
-        mock_account_instance.key = b'test_key'
-        mock_account.from_key.return_value = mock_account_instance
+        self.mock_account_instance = Mock()
+        self.mock_account_instance.address = WALLET_ADDRESS
+        self.mock_account_instance.key = b'test_key'
+        self.mock_account_instance.sign_transaction.return_value = Mock(raw_transaction=b'signed_tx')
+        mocks['account'].from_key.return_value = self.mock_account_instance
         
         # Set up ABI mock
-        mock_load_abi.return_value = [{"type": "function", "name": "batchMint"}]
+        mocks['load_abi'].return_value = [{"type": "function", "name": "batchMint"}]
         
         # Set up contract mock
-        mock_contract = Mock()
-        mock_contract.functions.totalSupply.return_value.call.return_value = 100
-        mock_contract.functions.maxSupply.return_value.call.return_value = 1000
-        mock_contract.functions.mintLive.return_value.call.return_value = True
-        mock_contract.functions.quoteBatchMint.return_value.call.return_value = (0, 0)
-        
-        mock_batch_mint = Mock()
-        mock_batch_mint.build_transaction.return_value = {
-            'chainId': 80085,
-            'from': '0x' + '2' * 40,
+        self.mock_contract = _make_contract_mock(batch_mint_tx={
+            'chainId': 80084,
+            'from': WALLET_ADDRESS,
             'value': 0,
             'gas': 150000,
             'gasPrice': 20000000000,
             'nonce': 0
-        }
-        mock_contract.functions.batchMint.return_value = mock_batch_mint
-        
-        mock_web3.eth.contract.return_value = mock_contract
+        })
+        mock_web3.eth.contract.return_value = self.mock_contract
         
-        # Create minter and execute full flow
-        minter = NFTMinter(config, dry_run=False)
-        
-        # Connect
-        minter.connect()
+        self.minter = NFTMinter(config, dry_run=False)
+    
+    def test_flow_connect(self):
+        """Test that connecting sets up web3, the chain ID and the account."""
+        self.minter.connect()
         
-        # Load contract
-        minter.load_contract()
+        self.assertIs(self.minter.web3, self.mock_web3)
+        self.assertEqual(self.minter.chain_id, 80084)
+        self.assertIs(self.minter.account, self.mock_account_instance)
+        self.assertEqual(self.minter.nonce, 0)
+    
+    def test_flow_load_contract(self):
+        """Test that the contract loads from the configured ABI and reports mint status."""
+        self.minter.connect()
+        self.minter.load_contract()
         
-        # Get contract info
-        info = minter.get_contract_info()
+        self.assertIs(self.minter.contract, self.mock_contract)
+        info = self.minter.get_contract_info()
         self.assertTrue(info['mint_live'])
+    
+    def test_full_minting_flow(self):
+        """Test the complete minting flow from connection to transaction."""
+        self.minter.connect()
+        self.minter.load_contract()
         
-        # Mint
-        tx_hash = minter.mint()
+        tx_hash = self.minter.mint()
         
         # Verify transaction was sent
         self.assertEqual(tx_hash, b'tx_hash'.hex())
-        mock_web3.eth.send_raw_transaction.assert_called_once()
-        mock_web3.eth.wait_for_transaction_receipt.assert_called_once()
-
+        self.mock_web3.eth.send_raw_transaction.assert_called_once_with(b'signed_tx')
+        self.mock_web3.eth.wait_for_transaction_receipt.assert_called_once()
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""
+Network Configuration Tests
+
+This module contains tests for the network configuration lookups.
+"""
+
+import unittest
+
+# Add parent directory to path
+import os
+import sys
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from src.networks import (
+    NETWORKS, get_network_config, get_network_by_chain_id, validate_chain_id
+)
+from src.exceptions import ConfigurationError
+
+
+# Chain IDs the live networks report from eth_chainId. connect() refuses
+# any mismatch, so a wrong value here makes the network unusable.
+_EXPECTED_CHAIN_IDS = (
+    ('ARBITRUM_ONE', 42161),
+    ('ARBITRUM_NOVA', 42170),
+    ('ARBITRUM_SEPOLIA', 421614),
+    ('BERACHAIN', 80084),  # bArtio
+)
+
+
+class TestNetworks(unittest.TestCase):
+    """Test cases for network configuration lookups."""
+
+    def test_chain_ids(self):
+        """Test that every network is pinned to its real chain ID."""
+        self.assertEqual(set(NETWORKS), {name for name, _ in _EXPECTED_CHAIN_IDS})
+
+        for name, chain_id in _EXPECTED_CHAIN_IDS:
+            with self.subTest(network=name):
+                self.assertEqual(get_network_config(name)['chain_id'], chain_id)
+                self.assertTrue(validate_chain_id(name, chain_id))
+                self.assertEqual(get_network_by_chain_id(chain_id), name)
+
+    def test_explorer_api_matches_chain_id(self):
+        """Test that chain-scoped explorer APIs use the network's chain ID."""
+        config = get_network_config('BERACHAIN')
+        self.assertIn(f"/{config['chain_id']}/", config['explorer']['api_url'])
+
+    def test_unknown_network(self):
+        """Test that unknown networks and chain IDs are rejected."""
+        with self.assertRaises(ConfigurationError):
+            get_network_config('UNKNOWN')
+        self.assertIsNone(get_network_by_chain_id(80085))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,14 +14,18 @@ import json
 import tempfile
 import os
 import logging
+import shutil
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock, mock_open
 import requests
 from datetime import datetime
 
 # Add parent directory to path for imports
 import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from src.utils import (
     setup_logging, validate_ethereum_address, validate_private_key,
@@ -32,6 +36,69 @@ from src.utils import (
 )
 
 
+# Addresses validate_ethereum_address must accept, in each format they come in
+_VALID_ADDRESSES = (
+    '0x' + '1' * 40,  # All lowercase hex
+    '0x' + 'A' * 40,  # All uppercase hex
+    '0x' + 'aB' * 20,  # Mixed case pattern
+    '0x742d35Cc6634C0532925a3b844Bc9e7595f0F0fa',  # Real checksum address
+    '0x5aAeb6053f3E94C9b9A09f33669435E7Ef1BeAed',  # Another real address
+)
+
+# Addresses it must reject: all the ways an address can be wrong
+_INVALID_ADDRESSES = (
+    '',  # Empty string
+    None,  # None value
+    '0x',  # Just the prefix
+    '0x' + '1' * 39,  # Too short by one character
+    '0x' + '1' * 41,  # Too long by one character
+    '1' * 40,  # Missing 0x prefix
+    '0x' + 'G' * 40,  # Invalid hex characters (G is not hex)
+    'not_an_address',  # Completely wrong format
+    '0X' + '1' * 40,  # Wrong case for prefix (should be 0x not 0X)
+    '0x' + '1' * 40 + '\n',  # Trailing newline
+)
+
+# Private keys validate_private_key must accept, with or without 0x prefix
+_VALID_KEYS = (
+    '1' * 64,  # Without 0x prefix
+    '0x' + '1' * 64,  # With 0x prefix
+    'a' * 64,  # Lowercase hex
+    'A' * 64,  # Uppercase hex
+    'aAbBcCdDeEfF' * 5 + 'aAbB',  # Mixed case (64 chars total)
+    '0x' + 'deadbeef' * 8,  # Common test pattern
+)
+
+# Private keys it must reject
+_INVALID_KEYS = (
+    '',  # Empty string
+    None,  # None value
+    '1' * 63,  # Too short
+    '1' * 65,  # Too long
+    '0x' + '1' * 63,  # Too short with prefix
+    'G' * 64,  # Invalid hex characters
+    'not_a_private_key',  # Completely invalid
+    '0x',  # Just prefix
+    '0x' + 'zzzz' + '1' * 60,  # Contains non-hex chars
+    '1' * 64 + '\n',  # Trailing newline
+    '11' * 31 + '  ',  # Padded with whitespace to 64 chars
+)
+
+
+def _fake_response(payload):
+    """Build a minimal requests.Response stand-in returning payload from json()."""
+    return SimpleNamespace(json=lambda: payload, raise_for_status=lambda: None)
+
+
+class _TempDirMixin:
+    """Give each test a fresh temporary directory as self.temp_dir."""
+    
+    def setUp(self):
+        """Create the temporary directory and schedule its removal."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+
+
 class TestValidationFunctions(unittest.TestCase):
     """
     Test cases for validation functions.
@@ -43,16 +110,7 @@ class TestValidationFunctions(unittest.TestCase):
     
     def test_validate_ethereum_address_valid(self):
         """Test validation of valid Ethereum addresses."""
-        # Valid addresses come in different formats - let's test them all
-        valid_addresses = [
-            '0x' + '1' * 40,  # All lowercase hex
-            '0x' + 'A' * 40,  # All uppercase hex
-            '0x' + 'aB' * 20,  # Mixed case pattern
-            '0x742d35Cc6634C0532925a3b844Bc9e7595f0F0fa',  # Real checksum address
-            '0x5aAeb6053f3E94C9b9A09f33669435E7Ef1BeAed',  # Another real address
-        ]
-        
-        for address in valid_addresses:
+        for address in _VALID_ADDRESSES:
             with self.subTest(address=address):
                 # Each address should validate as True
                 self.assertTrue(
@@ -62,40 +120,28 @@ class TestValidationFunctions(unittest.TestCase):
     
     def test_validate_ethereum_address_invalid(self):
         """Test validation of invalid Ethereum addresses."""
-        # These are all the ways an address can be wrong
-        invalid_addresses = [
-            '',  # Empty string
-            None,  # None value
-            '0x',  # Just the prefix
-            '0x' + '1' * 39,  # Too short by one character
-            '0x' + '1' * 41,  # Too long by one character
-            '1' * 40,  # Missing 0x prefix
-            '0x' + 'G' * 40,  # Invalid hex characters (G is not hex)
-            'not_an_address',  # Completely wrong format
-            '0X' + '1' * 40,  # Wrong case for prefix (should be 0x not 0X)
-        ]
-        
-        for address in invalid_addresses:
+        for address in _INVALID_ADDRESSES:
             with self.subTest(address=address):
                 # Each should validate as False
                 self.assertFalse(
                     validate_ethereum_address(address),
                     f"Address {address} should be invalid"
                 )
-    
+
+    def test_validate_ethereum_address_checksum(self):
+        """Test opt-in EIP-55 checksum validation."""
+        checksummed = '0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed'
+        self.assertTrue(validate_ethereum_address(checksummed, check_checksum=True))
+        # Single-case addresses carry no checksum
+        self.assertTrue(validate_ethereum_address(checksummed.lower(), check_checksum=True))
+        self.assertTrue(validate_ethereum_address('0x' + 'A' * 40, check_checksum=True))
+        # A flipped letter only fails when the checksum is requested
+        self.assertFalse(validate_ethereum_address(checksummed[:-1] + 'D', check_checksum=True))
+        self.assertTrue(validate_ethereum_address(checksummed[:-1] + 'D'))
+
     def test_validate_private_key_valid(self):
         """Test validation of valid private keys."""
-        # Private keys can come with or without 0x prefix
-        valid_keys = [
-            '1' * 64,  # Without 0x prefix
-            '0x' + '1' * 64,  # With 0x prefix
-            'a' * 64,  # Lowercase hex
-            'A' * 64,  # Uppercase hex
-            'aAbBcCdDeEfF' * 5 + 'aAbB',  # Mixed case (64 chars total)
-            '0x' + 'deadbeef' * 8,  # Common test pattern
-        ]
-        
-        for key in valid_keys:
+        for key in _VALID_KEYS:
             with self.subTest(key=key[:10] + '...'):
                 # Show only first 10 chars in test name for security
                 self.assertTrue(
@@ -105,19 +151,7 @@ class TestValidationFunctions(unittest.TestCase):
     
     def test_validate_private_key_invalid(self):
         """Test validation of invalid private keys."""
-        invalid_keys = [
-            '',  # Empty string
-            None,  # None value
-            '1' * 63,  # Too short
-            '1' * 65,  # Too long
-            '0x' + '1' * 63,  # Too short with prefix
-            'G' * 64,  # Invalid hex characters
-            'not_a_private_key',  # Completely invalid
-            '0x',  # Just prefix
-            '0x' + 'zzzz' + '1' * 60,  # Contains non-hex chars
-        ]
-        
-        for key in invalid_keys:
+        for key in _INVALID_KEYS:
             with self.subTest(key=str(key)[:10] + '...' if key else 'None'):
                 self.assertFalse(
                     validate_private_key(key),
@@ -125,7 +159,7 @@ class TestValidationFunctions(unittest.TestCase):
                 )
 
 
-class TestFileOperations(unittest.TestCase):
+class TestFileOperations(_TempDirMixin, unittest.TestCase):
     """
     Test cases for file operation functions.
     
@@ -133,15 +167,6 @@ class TestFileOperations(unittest.TestCase):
     including error handling for missing or malformed files.
     """
     
-    def setUp(self):
-        """Create a temporary directory for file tests."""
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def tearDown(self):
-        """Clean up temporary directory after tests."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
-    
     def test_load_json_file_success(self):
         """Test successful loading of JSON file."""
         # Create a test JSON file with some data
@@ -211,6 +236,59 @@ class TestFileOperations(unittest.TestCase):
             content = f.read()
         self.assertIn('  ', content)  # Should have indentation
     
+    def test_save_json_file_large_integers(self):
+        """Test that wei-sized integers beyond 64 bits are saved exactly."""
+        test_data = {"value_wei": 10 ** 30}
+        output_file = Path(self.temp_dir) / "large.json"
+        
+        save_json_file(test_data, output_file)
+        
+        with open(output_file, 'r') as f:
+            self.assertEqual(json.load(f), test_data)
+    
+    def test_load_json_file_large_integers(self):
+        """Test that wei-sized integers beyond 64 bits are loaded exactly."""
+        test_file = Path(self.temp_dir) / "large.json"
+        test_file.write_text('{"value_wei": 1000000000000000000000000000000, "gas": 21000}')
+        
+        result = load_json_file(test_file)
+        
+        self.assertEqual(result, {"value_wei": 10 ** 30, "gas": 21000})
+        self.assertIsInstance(result["value_wei"], int)
+    
+    def test_json_file_round_trip_edge_values(self):
+        """Test that wide negative integers and non-finite floats survive a round trip."""
+        test_data = {
+            "below_int64": -2 ** 63 - 1,
+            "nan": float("nan"),
+            "inf": float("inf"),
+            "missing": None
+        }
+        output_file = Path(self.temp_dir) / "edge.json"
+        
+        save_json_file(test_data, output_file)
+        result = load_json_file(output_file)
+        
+        self.assertEqual(result["below_int64"], -9223372036854775809)
+        self.assertIsInstance(result["below_int64"], int)
+        self.assertNotEqual(result["nan"], result["nan"])  # NaN, not None
+        self.assertEqual(result["inf"], float("inf"))
+        self.assertIsNone(result["missing"])
+    
+    def test_save_json_file_atomic(self):
+        """Test that a failed save leaves the existing file untouched."""
+        output_file = Path(self.temp_dir) / "atomic.json"
+        save_json_file({"version": 1}, output_file)
+
+        with patch('src.utils.os.replace', side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                save_json_file({"version": 2}, output_file)
+
+        # The old content survives and the temporary file is cleaned up
+        with open(output_file, 'r') as f:
+            self.assertEqual(json.load(f), {"version": 1})
+        self.assertEqual(os.listdir(self.temp_dir), ["atomic.json"])
+
     def test_save_json_file_creates_directory(self):
         """Test that save_json_file creates parent directories if needed."""
         # Create a nested path that doesn't exist
@@ -233,7 +311,7 @@ class TestFileOperations(unittest.TestCase):
         self.assertEqual(loaded, test_data)
 
 
-class TestABIOperations(unittest.TestCase):
+class TestABIOperations(_TempDirMixin, unittest.TestCase):
     """
     Test cases for ABI-related functions.
     
@@ -242,15 +320,6 @@ class TestABIOperations(unittest.TestCase):
     file formats and fetch them from block explorers.
     """
     
-    def setUp(self):
-        """Set up temporary directory for ABI tests."""
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def tearDown(self):
-        """Clean up temporary directory."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
-    
     def test_load_abi_from_file_direct_array(self):
         """Test loading ABI that's a direct JSON array."""
         # This is the simplest ABI format - just an array
@@ -303,6 +372,26 @@ class TestABIOperations(unittest.TestCase):
         loaded_abi = load_abi_from_file(abi_file)
         self.assertEqual(loaded_abi, abi_data)
     
+    def test_load_abi_from_file_cached_until_modified(self):
+        """Test that a parsed ABI is reused until the file changes."""
+        abi_file = Path(self.temp_dir) / "cached.json"
+        with open(abi_file, 'w') as f:
+            json.dump([{"type": "function", "name": "mint"}], f)
+        
+        with patch('src.utils.load_json_file', wraps=load_json_file) as mock_load:
+            first = load_abi_from_file(abi_file)
+            second = load_abi_from_file(abi_file)
+            self.assertEqual(first, second)
+            self.assertEqual(mock_load.call_count, 1)
+            
+            # Rewriting the file (different size) invalidates the cache
+            with open(abi_file, 'w') as f:
+                json.dump([{"type": "function", "name": "batchMint"}], f)
+            
+            third = load_abi_from_file(abi_file)
+            self.assertEqual(third[0]['name'], 'batchMint')
+            self.assertEqual(mock_load.call_count, 2)
+    
     def test_load_abi_from_file_invalid_format(self):
         """Test loading ABI with invalid format raises error."""
         # This JSON doesn't contain an ABI in any recognized format
@@ -317,31 +406,28 @@ class TestABIOperations(unittest.TestCase):
         
         self.assertIn("Could not find ABI", str(cm.exception))
     
-    @patch('requests.get')
-    def test_get_contract_abi_from_explorer_success(self, mock_get):
+    def test_get_contract_abi_from_explorer_success(self):
         """Test successful ABI fetch from block explorer."""
         # When the explorer returns a successful response, we should get the ABI
         abi_data = [{"type": "function", "name": "mint"}]
         
-        # Mock the response object
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        # Fake the session and its response object
+        session = Mock()
+        session.get.return_value = _fake_response({
             "status": "1",  # Status 1 means success
             "result": json.dumps(abi_data)  # ABI is JSON-encoded in result
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        })
         
         # Call the function - it should succeed and return the parsed ABI
         result = get_contract_abi_from_explorer(
-            "0x123...", "test_key", "https://api.test.com"
+            "0x123...", "test_key", "https://api.test.com", session=session
         )
         
         # Verify we got the correct ABI back
         self.assertEqual(result, abi_data)
         
         # Verify the API was called correctly
-        mock_get.assert_called_once_with(
+        session.get.assert_called_once_with(
             "https://api.test.com",
             params={
                 "module": "contract",
@@ -352,22 +438,18 @@ class TestABIOperations(unittest.TestCase):
             timeout=30
         )
     
-    @patch('requests.get')
-    def test_get_contract_abi_from_explorer_api_error(self, mock_get):
+    def test_get_contract_abi_from_explorer_api_error(self):
         """Test handling of API error response."""
         # When the explorer returns an error, we should get an exception
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        session = SimpleNamespace(get=lambda *args, **kwargs: _fake_response({
             "status": "0",  # Status 0 means error
             "result": "Contract source code not verified"
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        }))
         
         # This should raise an exception with the error message
         with self.assertRaises(Exception) as cm:
             get_contract_abi_from_explorer(
-                "0x123...", "test_key", "https://api.test.com"
+                "0x123...", "test_key", "https://api.test.com", session=session
             )
         
         self.assertIn("API error", str(cm.exception))
@@ -493,7 +575,7 @@ class TestFormattingFunctions(unittest.TestCase):
                 self.assertEqual(result, expected)
 
 
-class TestMiscellaneousFunctions(unittest.TestCase):
+class TestMiscellaneousFunctions(_TempDirMixin, unittest.TestCase):
     """
     Test cases for miscellaneous utility functions.
     
@@ -501,71 +583,54 @@ class TestMiscellaneousFunctions(unittest.TestCase):
     helper functions that don't fit into the other categories.
     """
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
-    
-    @patch('src.utils.save_json_file')
-    @patch('src.utils.Path')
-    def test_create_example_abi(self, mock_path_class, mock_save):
+    def test_create_example_abi(self):
         """Test example ABI creation"""
+        recorded = []
+        create_example_abi(
+            saver=lambda data, path: recorded.append((data, path)),
+            path_factory=lambda name: Path(self.temp_dir) / name,
+        )
 
-        with patch("pathlib.Path.mkdir") as mock_mkdir:
+        # Verify the abi directory was created and save was called once
+        self.assertTrue((Path(self.temp_dir) / "abi").is_dir())
+        self.assertEqual(len(recorded), 1)
 
-            # Create example ABI
-            create_example_abi()
-        
-            # Verify mkdir was called to create the abi directory
-            mock_mkdir.assert_any_call(parents=True, exist_ok=True)
-        
-            # Verify save was called
-            mock_save.assert_called_once()
-        
-            # Check that the saved data is a list (ABI format)
-            saved_data, saved_path = mock_save.call_args[0]
-            self.assertIsInstance(saved_data, list)
-            self.assertIn("example_nft_abi.json", str(saved_path))
+        # Check that the saved data is a list (ABI format)
+        saved_data, saved_path = recorded[0]
+        self.assertIsInstance(saved_data, list)
+        self.assertEqual(saved_path.name, "example_nft_abi.json")
 
-            # Check for expected function names in the ABI
-            function_names = [item.get('name') for item in saved_data if item.get('name')]
-            expected_functions = ['totalSupply', 'maxSupply', 'mintLive', 'batchMint']
-
-            for func_name in expected_functions:
-                self.assertIn(func_name, function_names)
+        # Check for expected function names in the ABI
+        function_names = {item.get('name') for item in saved_data if item.get('name')}
+        self.assertLessEqual({'totalSupply', 'maxSupply', 'mintLive', 'batchMint'}, function_names)
     
-    @patch('builtins.__import__')
-    def test_check_dependencies_all_installed(self, mock_import):
+    @patch('importlib.util.find_spec')
+    def test_check_dependencies_all_installed(self, mock_find_spec):
         """Test dependency check when all packages are installed."""
-        # Mock successful imports - everything is installed
-        mock_import.return_value = Mock()
+        # Mock successful lookups - everything is installed
+        mock_find_spec.return_value = Mock()
         
         all_installed, missing = check_dependencies()
         
         self.assertTrue(all_installed)
         self.assertEqual(missing, [])
         
-        # Verify we tried to import the expected packages
+        # Verify we looked up the expected packages
         expected_imports = ['web3', 'eth_account', 'requests', 'tqdm']
-        actual_imports = [call[0][0] for call in mock_import.call_args_list]
+        actual_imports = [call[0][0] for call in mock_find_spec.call_args_list]
         for pkg in expected_imports:
             self.assertIn(pkg, actual_imports)
     
-    @patch('builtins.__import__')
-    def test_check_dependencies_some_missing(self, mock_import):
+    @patch('importlib.util.find_spec')
+    def test_check_dependencies_some_missing(self, mock_find_spec):
         """Test dependency check when some packages are missing."""
-        # Mock import to fail for specific packages
-        def import_side_effect(name, *args, **kwargs):
-            # Simulate that eth_account and tqdm are not installed
+        # Simulate that eth_account and tqdm are not installed
+        def find_spec_side_effect(name, *args, **kwargs):
             if name in ['eth_account', 'tqdm']:
-                raise ImportError(f"No module named '{name}'")
+                return None
             return Mock()
         
-        mock_import.side_effect = import_side_effect
+        mock_find_spec.side_effect = find_spec_side_effect
         
         all_installed, missing = check_dependencies()
         
@@ -579,14 +644,12 @@ class TestMiscellaneousFunctions(unittest.TestCase):
     
     @patch('logging.getLogger')
     @patch('logging.basicConfig')
-    @patch('src.utils.datetime')
+    @patch('src.utils.time')
     @patch('src.utils.Path')
-    def test_setup_logging(self, mock_path_class, mock_datetime, mock_basic_config, mock_get_logger):
+    def test_setup_logging(self, mock_path_class, mock_time, mock_basic_config, mock_get_logger):
         """Test logging setup with comprehensive mocking."""
-        # Mock the datetime to return a fixed timestamp
-        mock_now = Mock()
-        mock_now.strftime.return_value = "20240115_120000"
-        mock_datetime.now.return_value = mock_now
+        # Mock the clock to return a fixed timestamp
+        mock_time.strftime.return_value = "20240115_120000"
         
         # Mock Path to handle directory creation and file path operations
         mock_log_dir = Mock()
@@ -600,12 +663,21 @@ class TestMiscellaneousFunctions(unittest.TestCase):
         mock_get_logger.return_value = mock_logger
         
         # Mock the handlers that will be created
-        with patch('logging.FileHandler') as mock_file_handler, \
+        with patch('logging.handlers.RotatingFileHandler') as mock_file_handler, \
+             patch('logging.handlers.MemoryHandler') as mock_memory_handler, \
              patch('logging.StreamHandler') as mock_stream_handler:
             
             # Setup logging with DEBUG level
             logger = setup_logging(logging.DEBUG)
         
+        # Verify file output is rotated and buffered in front of the file
+        mock_file_handler.assert_called_once_with(
+            mock_log_file, maxBytes=10_000_000, backupCount=3
+        )
+        mock_memory_handler.assert_called_once_with(
+            256, flushLevel=logging.WARNING, target=mock_file_handler.return_value
+        )
+        
         # Verify log directory was created
         mock_log_dir.mkdir.assert_called_once_with(exist_ok=True)
         
@@ -683,7 +755,7 @@ class TestEdgeCases(unittest.TestCase):
         self.assertEqual(reason2, "Out of tokens")
 
 
-class TestIntegrationScenarios(unittest.TestCase):
+class TestIntegrationScenarios(_TempDirMixin, unittest.TestCase):
     """
     Integration tests for utility functions working together.
     
@@ -691,15 +763,6 @@ class TestIntegrationScenarios(unittest.TestCase):
     when used in combination, simulating real-world usage patterns.
     """
     
-    def setUp(self):
-        """Set up test environment."""
-        self.temp_dir = tempfile.mkdtemp()
-        
-    def tearDown(self):
-        """Clean up test environment."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
-    
     def test_abi_workflow(self):
         """Test complete ABI workflow: create, save, and load."""
         # This simulates the full lifecycle of working with an ABI
@@ -898,25 +961,24 @@ class TestRealWorldScenarios(unittest.TestCase):
             self.assertIsInstance(formatted_gas, str)
             self.assertIn("gwei", formatted_gas)
     
-    @patch('requests.get')
-    def test_contract_deployment_verification(self, mock_get):
+    def test_contract_deployment_verification(self):
         """Test verifying a newly deployed contract."""
         # Simulate checking if a contract's ABI is verified on explorer
         
         contract_address = "0x1234567890123456789012345678901234567890"
+        session = Mock()
         
         # First attempt - not verified yet
-        mock_response_unverified = Mock()
-        mock_response_unverified.json.return_value = {
+        session.get.return_value = _fake_response({
             "status": "0",
             "result": "Contract source code not verified"
-        }
-        mock_response_unverified.raise_for_status.return_value = None
-        mock_get.return_value = mock_response_unverified
+        })
         
         # Should fail to get ABI
         with self.assertRaises(Exception) as cm:
-            get_contract_abi_from_explorer(contract_address, "api_key", "https://api.etherscan.io/api")
+            get_contract_abi_from_explorer(
+                contract_address, "api_key", "https://api.etherscan.io/api", session=session
+            )
         
         self.assertIn("not verified", str(cm.exception))
         
@@ -925,15 +987,15 @@ class TestRealWorldScenarios(unittest.TestCase):
             {"type": "function", "name": "mint"},
             {"type": "function", "name": "totalSupply"}
         ]
-        mock_response_verified = Mock()
-        mock_response_verified.json.return_value = {
+        session.get.return_value = _fake_response({
             "status": "1",
             "result": json.dumps(abi_data)
-        }
-        mock_get.return_value = mock_response_verified
+        })
         
         # Should successfully get ABI
-        result = get_contract_abi_from_explorer(contract_address, "api_key", "https://api.etherscan.io/api")
+        result = get_contract_abi_from_explorer(
+            contract_address, "api_key", "https://api.etherscan.io/api", session=session
+        )
         self.assertEqual(result, abi_data)
 
 